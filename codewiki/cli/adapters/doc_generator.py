@@ -148,6 +148,11 @@ class CLIDocumentationGenerator:
                 target_file=self.target_file,
                 use_claude_code=self.config.get('use_claude_code', False),
                 use_gemini_code=self.config.get('use_gemini_code', False),
+                gemini_code_concurrency=self.config.get('gemini_code_concurrency', 4),
+                gemini_cache_enabled=self.config.get('gemini_cache_enabled', False),
+                gemini_cache_ttl=self.config.get('gemini_cache_ttl'),
+                gemini_disable_sandbox=self.config.get('gemini_disable_sandbox', False),
+                affect_depth=self.config.get('affect_depth', 1),
             )
             
             # Run backend documentation generation
@@ -83,6 +83,33 @@ def config_group():
     type=int,
     help="Maximum depth for hierarchical decomposition (default: 2)"
 )
+@click.option(
+    "--gemini-code-concurrency",
+    type=int,
+    help="Maximum concurrent Gemini CLI invocations for module docs (default: 4)"
+)
+@click.option(
+    "--gemini-cache/--no-gemini-cache",
+    "gemini_cache_enabled",
+    default=None,
+    help="Cache Gemini CLI clustering and overview responses on disk (default: off)"
+)
+@click.option(
+    "--gemini-cache-ttl",
+    type=int,
+    help="Lifetime of cached Gemini responses in seconds, 0 for no expiry (default: 0)"
+)
+@click.option(
+    "--gemini-disable-sandbox/--gemini-enable-sandbox",
+    "gemini_disable_sandbox",
+    default=None,
+    help="Run Gemini CLI without its sandbox; trusted, isolated environments only (default: sandboxed)"
+)
+@click.option(
+    "--affect-depth",
+    type=int,
+    help="Levels of dependents to re-document when components change (default: 1)"
+)
 def config_set(
     api_key: Optional[str],
     base_url: Optional[str],
@@ -92,7 +119,12 @@ def config_set(
     max_tokens: Optional[int],
     max_token_per_module: Optional[int],
     max_token_per_leaf_module: Optional[int],
-    max_depth: Optional[int]
+    max_depth: Optional[int],
+    gemini_code_concurrency: Optional[int],
+    gemini_cache_enabled: Optional[bool],
+    gemini_cache_ttl: Optional[int],
+    gemini_disable_sandbox: Optional[bool],
+    affect_depth: Optional[int]
 ):
     """
     Set configuration values for CodeWiki.
@@ -124,10 +156,20 @@ def config_set(
     \b
     # Set max depth for hierarchical decomposition
     $ codewiki config set --max-depth 3
+    
+    \b
+    # Cache Gemini CLI responses for a day and run 8 CLI calls at once
+    $ codewiki config set --gemini-cache --gemini-cache-ttl 86400 --gemini-code-concurrency 8
+    
+    \b
+    # Also re-document dependents of dependents of changed components
+    $ codewiki config set --affect-depth 2
     """
     try:
         # Check if at least one option is provided
-        if not any([api_key, base_url, main_model, cluster_model, fallback_model, max_tokens, max_token_per_module, max_token_per_leaf_module, max_depth]):
+        new_settings = [gemini_code_concurrency, gemini_cache_enabled, gemini_cache_ttl, gemini_disable_sandbox, affect_depth]
+        if not any([api_key, base_url, main_model, cluster_model, fallback_model, max_tokens, max_token_per_module, max_token_per_leaf_module, max_depth]) \
+                and all(value is None for value in new_settings):
             click.echo("No options provided. Use --help for usage information.")
             sys.exit(EXIT_CONFIG_ERROR)
         
@@ -169,6 +211,21 @@ def config_set(
                 raise ConfigurationError("max_depth must be a positive integer")
             validated_data['max_depth'] = max_depth
         
+        if gemini_code_concurrency is not None:
+            if gemini_code_concurrency < 1:
+                raise ConfigurationError("gemini_code_concurrency must be a positive integer")
+            validated_data['gemini_code_concurrency'] = gemini_code_concurrency
+        
+        if gemini_cache_ttl is not None:
+            if gemini_cache_ttl < 0:
+                raise ConfigurationError("gemini_cache_ttl must be a non-negative integer")
+            validated_data['gemini_cache_ttl'] = gemini_cache_ttl
+        
+        if affect_depth is not None:
+            if affect_depth < 0:
+                raise ConfigurationError("affect_depth must be a non-negative integer")
+            validated_data['affect_depth'] = affect_depth
+        
         # Create config manager and save
         manager = ConfigManager()
         manager.load()  # Load existing config if present
@@ -182,7 +239,12 @@ def config_set(
             max_tokens=validated_data.get('max_tokens'),
             max_token_per_module=validated_data.get('max_token_per_module'),
             max_token_per_leaf_module=validated_data.get('max_token_per_leaf_module'),
-            max_depth=validated_data.get('max_depth')
+            max_depth=validated_data.get('max_depth'),
+            gemini_code_concurrency=validated_data.get('gemini_code_concurrency'),
+            gemini_cache_enabled=gemini_cache_enabled,
+            gemini_cache_ttl=validated_data.get('gemini_cache_ttl'),
+            gemini_disable_sandbox=gemini_disable_sandbox,
+            affect_depth=validated_data.get('affect_depth')
         )
         
         # Display success messages
@@ -231,6 +293,27 @@ def config_set(
         if max_depth:
             click.secho(f"✓ Max depth: {max_depth}", fg="green")
         
+        if gemini_code_concurrency:
+            click.secho(f"✓ Gemini CLI concurrency: {gemini_code_concurrency}", fg="green")
+        
+        if gemini_cache_enabled is not None:
+            click.secho(f"✓ Gemini response cache: {'enabled' if gemini_cache_enabled else 'disabled'}", fg="green")
+        
+        if gemini_cache_ttl is not None:
+            click.secho(f"✓ Gemini cache TTL: {f'{gemini_cache_ttl}s' if gemini_cache_ttl else 'no expiry'}", fg="green")
+        
+        if gemini_disable_sandbox is not None:
+            click.secho(f"✓ Gemini CLI sandbox: {'disabled' if gemini_disable_sandbox else 'enabled'}", fg="green")
+            if gemini_disable_sandbox:
+                click.secho(
+                    "\n⚠️  Gemini CLI runs in YOLO mode; without the sandbox its tool calls run "
+                    "directly on this machine. Only use this for trusted repositories.",
+                    fg="yellow"
+                )
+        
+        if affect_depth is not None:
+            click.secho(f"✓ Affect depth: {affect_depth}", fg="green")
+        
         click.echo("\n" + click.style("Configuration updated successfully.", fg="green", bold=True))
         
     except ConfigurationError as e:
@@ -291,6 +374,11 @@ def config_show(output_json: bool):
                 "max_token_per_module": config.max_token_per_module if config else 36369,
                 "max_token_per_leaf_module": config.max_token_per_leaf_module if config else 16000,
                 "max_depth": config.max_depth if config else 2,
+                "gemini_code_concurrency": config.gemini_code_concurrency if config else 4,
+                "gemini_cache_enabled": config.gemini_cache_enabled if config else False,
+                "gemini_cache_ttl": config.gemini_cache_ttl if config else None,
+                "gemini_disable_sandbox": config.gemini_disable_sandbox if config else False,
+                "affect_depth": config.affect_depth if config else 1,
                 "agent_instructions": config.agent_instructions.to_dict() if config and config.agent_instructions else {},
                 "config_file": str(manager.config_file_path)
             }
@@ -335,6 +423,15 @@ def config_show(output_json: bool):
             click.secho("Decomposition Settings", fg="cyan", bold=True)
             if config:
                 click.echo(f"  Max Depth:               {config.max_depth}")
+                click.echo(f"  Affect Depth:            {config.affect_depth}")
+            
+            click.echo()
+            click.secho("Gemini CLI Settings", fg="cyan", bold=True)
+            if config:
+                click.echo(f"  Concurrency:             {config.gemini_code_concurrency}")
+                click.echo(f"  Response Cache:          {'enabled' if config.gemini_cache_enabled else 'disabled'}")
+                click.echo(f"  Cache TTL:               {f'{config.gemini_cache_ttl}s' if config.gemini_cache_ttl else 'no expiry'}")
+                click.echo(f"  Sandbox:                 {'disabled' if config.gemini_disable_sandbox else 'enabled'}")
             
             click.echo()
             click.secho("Agent Instructions", fg="cyan", bold=True)
@@ -438,6 +438,12 @@ def generate_command(
                 # CLI integrations
                 'use_claude_code': use_claude_code,
                 'use_gemini_code': use_gemini_code,
+                'gemini_code_concurrency': config.gemini_code_concurrency,
+                'gemini_cache_enabled': config.gemini_cache_enabled,
+                'gemini_cache_ttl': config.gemini_cache_ttl,
+                'gemini_disable_sandbox': config.gemini_disable_sandbox,
+                # Incremental builds
+                'affect_depth': config.affect_depth,
             },
             verbose=verbose,
             generate_html=github_pages,
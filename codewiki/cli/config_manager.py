@@ -92,7 +92,12 @@ class ConfigManager:
         max_tokens: Optional[int] = None,
         max_token_per_module: Optional[int] = None,
         max_token_per_leaf_module: Optional[int] = None,
-        max_depth: Optional[int] = None
+        max_depth: Optional[int] = None,
+        gemini_code_concurrency: Optional[int] = None,
+        gemini_cache_enabled: Optional[bool] = None,
+        gemini_cache_ttl: Optional[int] = None,
+        gemini_disable_sandbox: Optional[bool] = None,
+        affect_depth: Optional[int] = None
     ):
         """
         Save configuration to file and keyring.
@@ -108,6 +113,11 @@ class ConfigManager:
             max_token_per_module: Maximum tokens per module for clustering
             max_token_per_leaf_module: Maximum tokens per leaf module
             max_depth: Maximum depth for hierarchical decomposition
+            gemini_code_concurrency: Maximum concurrent Gemini CLI invocations for module docs
+            gemini_cache_enabled: Whether to cache Gemini CLI responses on disk
+            gemini_cache_ttl: Lifetime of cached Gemini responses in seconds (0 = no expiry)
+            gemini_disable_sandbox: Run Gemini CLI without its sandbox
+            affect_depth: Levels of dependents to re-document when components change
         """
         # Ensure config directory exists
         try:
@@ -149,6 +159,16 @@ class ConfigManager:
             self._config.max_token_per_leaf_module = max_token_per_leaf_module
         if max_depth is not None:
             self._config.max_depth = max_depth
+        if gemini_code_concurrency is not None:
+            self._config.gemini_code_concurrency = gemini_code_concurrency
+        if gemini_cache_enabled is not None:
+            self._config.gemini_cache_enabled = gemini_cache_enabled
+        if gemini_cache_ttl is not None:
+            self._config.gemini_cache_ttl = gemini_cache_ttl or None
+        if gemini_disable_sandbox is not None:
+            self._config.gemini_disable_sandbox = gemini_disable_sandbox
+        if affect_depth is not None:
+            self._config.affect_depth = affect_depth
         
         # Validate configuration (only if base fields are set)
         if self._config.base_url and self._config.main_model and self._config.cluster_model:
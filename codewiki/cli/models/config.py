@@ -117,6 +117,11 @@ class Configuration:
         max_token_per_module: Maximum tokens per module for clustering (default: 36369)
         max_token_per_leaf_module: Maximum tokens per leaf module (default: 16000)
         max_depth: Maximum depth for hierarchical decomposition (default: 2)
+        gemini_code_concurrency: Maximum concurrent Gemini CLI invocations for module docs (default: 4)
+        gemini_cache_enabled: Whether to cache Gemini CLI responses on disk (default: False)
+        gemini_cache_ttl: Lifetime of cached Gemini responses in seconds (default: None, no expiry)
+        gemini_disable_sandbox: Run Gemini CLI without its sandbox (default: False)
+        affect_depth: Levels of dependents to re-document when components change (default: 1)
         agent_instructions: Custom agent instructions for documentation generation
     """
     base_url: str
@@ -128,6 +133,11 @@ class Configuration:
     max_token_per_module: int = 36369
     max_token_per_leaf_module: int = 16000
     max_depth: int = 2
+    gemini_code_concurrency: int = 4
+    gemini_cache_enabled: bool = False
+    gemini_cache_ttl: Optional[int] = None
+    gemini_disable_sandbox: bool = False
+    affect_depth: int = 1
     agent_instructions: AgentInstructions = field(default_factory=AgentInstructions)
     
     def validate(self):
@@ -153,6 +163,11 @@ class Configuration:
             'max_token_per_module': self.max_token_per_module,
             'max_token_per_leaf_module': self.max_token_per_leaf_module,
             'max_depth': self.max_depth,
+            'gemini_code_concurrency': self.gemini_code_concurrency,
+            'gemini_cache_enabled': self.gemini_cache_enabled,
+            'gemini_cache_ttl': self.gemini_cache_ttl,
+            'gemini_disable_sandbox': self.gemini_disable_sandbox,
+            'affect_depth': self.affect_depth,
         }
         if self.agent_instructions and not self.agent_instructions.is_empty():
             result['agent_instructions'] = self.agent_instructions.to_dict()
@@ -183,6 +198,11 @@ class Configuration:
             max_token_per_module=data.get('max_token_per_module', 36369),
             max_token_per_leaf_module=data.get('max_token_per_leaf_module', 16000),
             max_depth=data.get('max_depth', 2),
+            gemini_code_concurrency=data.get('gemini_code_concurrency', 4),
+            gemini_cache_enabled=data.get('gemini_cache_enabled', False),
+            gemini_cache_ttl=data.get('gemini_cache_ttl'),
+            gemini_disable_sandbox=data.get('gemini_disable_sandbox', False),
+            affect_depth=data.get('affect_depth', 1),
             agent_instructions=agent_instructions,
         )
     
@@ -237,6 +257,11 @@ class Configuration:
             max_token_per_module=self.max_token_per_module,
             max_token_per_leaf_module=self.max_token_per_leaf_module,
             max_depth=self.max_depth,
-            agent_instructions=final_instructions.to_dict() if final_instructions else None
+            agent_instructions=final_instructions.to_dict() if final_instructions else None,
+            gemini_code_concurrency=self.gemini_code_concurrency,
+            gemini_cache_enabled=self.gemini_cache_enabled,
+            gemini_cache_ttl=self.gemini_cache_ttl,
+            gemini_disable_sandbox=self.gemini_disable_sandbox,
+            affect_depth=self.affect_depth,
         )
 
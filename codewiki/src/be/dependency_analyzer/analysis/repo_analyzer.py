@@ -6,6 +6,7 @@ detailed file tree representations with filtering capabilities.
 """
 
 import os
+import re
 import fnmatch
 import json
 from pathlib import Path
@@ -13,6 +14,20 @@ from typing import Dict, List, Optional, Union
 from codewiki.src.be.dependency_analyzer.utils.patterns import DEFAULT_IGNORE_PATTERNS, DEFAULT_INCLUDE_PATTERNS
 
 
+def _compile_glob_patterns(patterns: List[str]) -> Optional[re.Pattern]:
+    """Compile fnmatch-style patterns into a single alternation regex.
+
+    Matching one combined pattern replaces a Python-level loop of
+    ``fnmatch.fnmatch`` calls, so the cost per path no longer grows with the
+    number of patterns.
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        "(?:" + "|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns) + ")"
+    )
+
+
 class RepoAnalyzer:
     def __init__(
         self,
@@ -30,6 +45,14 @@ class RepoAnalyzer:
             else list(DEFAULT_IGNORE_PATTERNS)
         )
 
+        # Precompiled forms of the pattern lists used by the per-path filters
+        self._exclude_glob = _compile_glob_patterns(self.exclude_patterns)
+        self._exclude_dir_prefixes = tuple(
+            p.rstrip("/") for p in self.exclude_patterns if p.endswith("/")
+        ) + tuple(p + "/" for p in self.exclude_patterns)
+        self._exclude_names = frozenset(self.exclude_patterns)
+        self._include_glob = _compile_glob_patterns(self.include_patterns)
+
     def analyze_repository_structure(self, repo_dir: str) -> Dict:
         file_tree = self._build_file_tree(repo_dir)
         return {
@@ -98,24 +121,25 @@ class RepoAnalyzer:
         return build_tree(Path(repo_dir), Path(repo_dir))
 
     def _should_exclude_path(self, path: str, filename: str) -> bool:
-        for pattern in self.exclude_patterns:
-            if fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(filename, pattern):
-                return True
-            if pattern.endswith("/") and path.startswith(pattern.rstrip("/")):
-                return True
-            if path.startswith(pattern + "/") or path == pattern:
-                return True
-            if pattern in path.split("/"):
-                return True
+        if self._exclude_glob is not None and (
+            self._exclude_glob.match(os.path.normcase(path))
+            or self._exclude_glob.match(os.path.normcase(filename))
+        ):
+            return True
+        if path.startswith(self._exclude_dir_prefixes):
+            return True
+        # Exact path match, or any path component equal to a pattern
+        if path in self._exclude_names or not self._exclude_names.isdisjoint(path.split("/")):
+            return True
         return False
 
     def _should_include_file(self, path: str, filename: str) -> bool:
-        if not self.include_patterns:
+        if self._include_glob is None:
             return True
-        for pattern in self.include_patterns:
-            if fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(filename, pattern):
-                return True
-        return False
+        return bool(
+            self._include_glob.match(os.path.normcase(path))
+            or self._include_glob.match(os.path.normcase(filename))
+        )
 
     def _count_files(self, tree: Dict) -> int:
         if tree["type"] == "file":
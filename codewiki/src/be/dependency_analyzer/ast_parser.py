@@ -9,6 +9,7 @@ import re
 
 from codewiki.src.be.dependency_analyzer.analysis.analysis_service import AnalysisService
 from codewiki.src.be.dependency_analyzer.models.core import Node
+from codewiki.src.be.graph_diff import compute_source_digest
 
 
 logger = logging.getLogger(__name__)
@@ -144,12 +145,35 @@ class DependencyParser:
                 break
         return path.replace(os.path.sep, ".")
     
-    def save_dependency_graph(self, output_path: str):
+    def save_dependency_graph(self, output_path: str, previous_graph: Optional[Dict[str, Any]] = None):
+        """
+        Save the parsed components as a dependency graph JSON file.
+
+        Args:
+            output_path: Path of the JSON file to write
+            previous_graph: Graph saved by the previous run, if any. Source digests
+                of components whose source is unchanged are reused from it instead
+                of re-normalizing and re-hashing the source.
+
+        Returns:
+            The saved graph dict
+        """
+        previous_graph = previous_graph or {}
         result = {}
+        reused_digests = 0
         for component_id, component in self.components.items():
             component_dict = component.model_dump()
             if 'depends_on' in component_dict and isinstance(component_dict['depends_on'], set):
                 component_dict['depends_on'] = list(component_dict['depends_on'])
+            # Lets the next run's graph diff compare digests instead of source text
+            source_code = component_dict.get('source_code')
+            previous = previous_graph.get(component_id)
+            if (isinstance(previous, dict) and previous.get('source_digest')
+                    and previous.get('source_code') == source_code):
+                component_dict['source_digest'] = previous['source_digest']
+                reused_digests += 1
+            else:
+                component_dict['source_digest'] = compute_source_digest(source_code)
             result[component_id] = component_dict
         
         dir_name = os.path.dirname(output_path)
@@ -159,5 +183,5 @@ class DependencyParser:
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(result, f, indent=2, ensure_ascii=False)
         
-        logger.debug(f"Saved {len(self.components)} components to {output_path}")
+        logger.debug(f"Saved {len(self.components)} components to {output_path} ({reused_digests} source digests reused)")
         return result
@@ -1,8 +1,10 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import os
+import shutil
 from codewiki.src.config import Config
 from codewiki.src.be.dependency_analyzer.ast_parser import DependencyParser
 from codewiki.src.be.dependency_analyzer.topo_sort import build_graph_from_components, get_leaf_nodes
+from codewiki.src.be.graph_diff import freeze_graph, load_graph
 from codewiki.src.utils import file_manager
 
 import logging
@@ -14,6 +16,11 @@ class DependencyGraphBuilder:
 
     def __init__(self, config: Config):
         self.config = config
+        # Graph of the last successfully documented run (None if there is none) and the one just built
+        self.previous_graph: Optional[Dict[str, Any]] = None
+        self.current_graph: Optional[Dict[str, Any]] = None
+        self._dependency_graph_path: Optional[str] = None
+        self._documented_graph_path: Optional[str] = None
 
     def build_dependency_graph(self) -> tuple[Dict[str, Any], List[str]]:
         """
@@ -32,6 +39,11 @@ class DependencyGraphBuilder:
             self.config.dependency_graph_dir, 
             f"{sanitized_repo_name}_dependency_graph.json"
         )
+        # Baseline for incremental builds, only advanced once docs were generated from it
+        documented_graph_path = os.path.join(
+            self.config.dependency_graph_dir,
+            f"{sanitized_repo_name}_documented_graph.json"
+        )
         filtered_folders_path = os.path.join(
             self.config.dependency_graph_dir, 
             f"{sanitized_repo_name}_filtered_folders.json"
@@ -61,8 +73,21 @@ class DependencyGraphBuilder:
         # Parse repository
         components = parser.parse_repository(filtered_folders)
         
+        # Diff against the last documented graph rather than the last saved one, so a
+        # run that fails before its docs are regenerated is redone by the next run
+        self.previous_graph = None
+        if os.path.exists(documented_graph_path):
+            try:
+                self.previous_graph = load_graph(documented_graph_path)
+            except ValueError as e:
+                logger.warning(f"Ignoring previous dependency graph: {e}")
+        self._dependency_graph_path = dependency_graph_path
+        self._documented_graph_path = documented_graph_path
+
         # Save dependency graph
-        parser.save_dependency_graph(dependency_graph_path)
+        self.current_graph = freeze_graph(
+            parser.save_dependency_graph(dependency_graph_path, previous_graph=self.previous_graph)
+        )
         
         # Build graph for traversal
         graph = build_graph_from_components(components)
@@ -101,3 +126,18 @@ class DependencyGraphBuilder:
                 logger.warning(f"Leaf node {leaf_node} not found in components, removing it")
         
         return components, keep_leaf_nodes
+
+    def save_documented_graph(self) -> None:
+        """
+        Record the graph just built as the baseline for the next incremental build.
+
+        Call this only after documentation generation has succeeded; until then
+        the next run keeps diffing against the previously documented graph.
+        """
+        if self._dependency_graph_path is None or self._documented_graph_path is None:
+            return
+
+        tmp_path = f"{self._documented_graph_path}.tmp"
+        shutil.copyfile(self._dependency_graph_path, tmp_path)
+        os.replace(tmp_path, self._documented_graph_path)
+        logger.debug(f"Saved documented dependency graph to {self._documented_graph_path}")
@@ -1,21 +1,30 @@
+import asyncio
+import hashlib
 import logging
 import os
+import re
 import json
-from typing import Dict, List, Any
-from copy import deepcopy
-import traceback
+from typing import Dict, List, Any, Optional, Tuple
 
 # Configure logging and monitoring
 logger = logging.getLogger(__name__)
 
+# Extracts the parent documentation body from an LLM overview response
+_OVERVIEW_RE = re.compile(r"<OVERVIEW>(.*?)</OVERVIEW>", re.DOTALL)
+
 # Local imports
 from codewiki.src.be.dependency_analyzer import DependencyGraphBuilder
 from codewiki.src.be.llm_services import call_llm
 from codewiki.src.be.prompt_template import (
-    REPO_OVERVIEW_PROMPT,
-    MODULE_OVERVIEW_PROMPT,
+    format_repo_overview_prompt,
+    format_module_overview_prompt,
 )
 from codewiki.src.be.cluster_modules import cluster_modules
+from codewiki.src.be.graph_diff import (
+    compare_dependency_graphs,
+    get_affected_components,
+    map_components_to_modules,
+)
 from codewiki.src.config import (
     Config,
     FIRST_MODULE_TREE_FILENAME,
@@ -34,7 +43,120 @@ class DocumentationGenerator:
         self.commit_id = commit_id
         self.graph_builder = DependencyGraphBuilder(config)
         self.agent_orchestrator = AgentOrchestrator(config)
+        # Parsed module tree JSON files keyed by path, stamped with (mtime_ns, size)
+        # so a file rewritten by another writer (e.g. the agent) is re-read.
+        self._module_tree_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        # Documentation writes running in the default executor, awaited before docs are read back
+        self._pending_writes: List[Tuple[asyncio.Future, str]] = []
+        # Digest of each parent's child docs when its docs were generated, keyed by module path
+        self._child_hashes: Dict[str, str] = {}
+
+    def _load_module_tree(self, path: str) -> Optional[Dict[str, Any]]:
+        """Load a module tree JSON file, reusing the parsed tree if the file is unchanged."""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            self._module_tree_cache.pop(path, None)
+            return None
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._module_tree_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        module_tree = file_manager.load_json(path)
+        self._module_tree_cache[path] = (stamp, module_tree)
+        return module_tree
+
+    def _save_module_tree(self, module_tree: Dict[str, Any], path: str) -> None:
+        """Save a module tree JSON file and write it through to the cache."""
+        file_manager.save_json(module_tree, path)
+        stat = os.stat(path)
+        self._module_tree_cache[path] = ((stat.st_mtime_ns, stat.st_size), module_tree)
     
+    def _save_text_async(self, content: str, path: str) -> None:
+        """Start writing a documentation file in a worker thread without waiting for it."""
+        loop = asyncio.get_running_loop()
+        self._pending_writes.append(
+            (loop.run_in_executor(None, file_manager.save_text, content, path), path)
+        )
+
+    async def _flush_pending_writes(self) -> None:
+        """Wait for all in-flight documentation writes to reach disk.
+
+        A failed write is logged against its own file rather than raised into
+        whichever caller happens to flush next.
+        """
+        pending, self._pending_writes = self._pending_writes, []
+        if not pending:
+            return
+        results = await asyncio.gather(*(future for future, _ in pending), return_exceptions=True)
+        for (_, path), result in zip(pending, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to write documentation to {path}: {result}")
+
+    def _child_docs_digest(self, module_tree: Dict[str, Any], module_path: List[str], working_dir: str) -> str:
+        """Hash the docs of a module's direct children, used to detect stale parent docs."""
+        children = module_tree
+        for path_part in module_path:
+            children = children[path_part].get("children", {})
+
+        digest = hashlib.blake2b(digest_size=16)
+        for child_name in sorted(children):
+            digest.update(child_name.encode("utf-8") + b"\0")
+            try:
+                with open(os.path.join(working_dir, f"{child_name}.md"), "rb") as f:
+                    digest.update(f.read())
+            except FileNotFoundError:
+                pass
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _invalidate_affected_docs(self, module_tree: Dict[str, Any],
+                                  leaves: List[Tuple[List[str], str, List[str]]],
+                                  parents: List[Tuple[List[str], str]],
+                                  working_dir: str) -> None:
+        """Remove docs of modules affected by changes since the last documented run.
+
+        Existing docs are otherwise kept as-is, so removing them is what makes the
+        generation loop redo exactly the affected modules. Parents are removed when
+        components listed on the parent itself are affected, and otherwise follow
+        through their child docs digests; the overview is removed whenever anything
+        changed.
+        """
+        old_graph = self.graph_builder.previous_graph
+        new_graph = self.graph_builder.current_graph
+        if old_graph is None or new_graph is None:
+            return
+
+        diff = compare_dependency_graphs(old_graph, new_graph)
+        if diff.is_empty:
+            logger.info("✓ Dependency graph unchanged since previous run")
+            return
+
+        affected = get_affected_components(diff.all_changed, new_graph, depth=self.config.affect_depth)
+        affected_modules = map_components_to_modules(affected, module_tree)
+        logger.info(
+            f"{len(diff.all_changed)} components changed, "
+            f"{len(affected_modules)} modules affected"
+        )
+
+        stale_docs = [OVERVIEW_FILENAME]
+        stale_docs.extend(
+            f"{module_name}.md" for module_path, module_name, _ in leaves
+            if "/".join(module_path) in affected_modules
+        )
+        stale_docs.extend(
+            f"{module_name}.md" for module_path, module_name in parents
+            if "/".join(module_path) in affected_modules
+        )
+        for filename in stale_docs:
+            try:
+                os.remove(os.path.join(working_dir, filename))
+                logger.debug(f"Removed stale docs {filename}")
+            except FileNotFoundError:
+                pass
+
     def create_documentation_metadata(self, working_dir: str, components: Dict[str, Any], num_leaf_nodes: int):
         """Create a metadata file with documentation generation information."""
         from datetime import datetime
@@ -56,7 +178,8 @@ class DocumentationGenerator:
                 "overview.md",
                 "module_tree.json",
                 "first_module_tree.json"
-            ]
+            ],
+            "child_hashes": self._child_hashes
         }
         
         # Add generated markdown files to the metadata
@@ -71,9 +194,22 @@ class DocumentationGenerator:
         file_manager.save_json(metadata, metadata_path)
 
     
-    def get_processing_order(self, module_tree: Dict[str, Any], parent_path: List[str] = []) -> List[tuple[List[str], str]]:
-        """Get the processing order using topological sort (leaf modules first)."""
-        processing_order = []
+    def get_processing_order(self, module_tree: Dict[str, Any], parent_path: List[str] = []) -> Tuple[
+        List[Tuple[List[str], str, List[str]]], List[Tuple[List[str], str]]
+    ]:
+        """
+        Get the processing order, partitioned into leaf and parent modules.
+
+        Both lists keep post-order (children before their parent), so processing all
+        leaves and then all parents still generates every child before its parent.
+        Leaf entries carry their component IDs so callers don't walk the tree again.
+
+        Returns:
+            Tuple of (leaves, parents) where leaves are (path, name, component_ids)
+            and parents are (path, name)
+        """
+        leaves = []
+        parents = []
         
         def collect_modules(tree: Dict[str, Any], path: List[str]):
             for module_name, module_info in tree.items():
@@ -83,13 +219,13 @@ class DocumentationGenerator:
                 if module_info.get("children") and isinstance(module_info["children"], dict) and module_info["children"]:
                     collect_modules(module_info["children"], current_path)
                     # Add this parent module after its children
-                    processing_order.append((current_path, module_name))
+                    parents.append((current_path, module_name))
                 else:
                     # This is a leaf module, add it immediately
-                    processing_order.append((current_path, module_name))
+                    leaves.append((current_path, module_name, module_info.get("components", [])))
         
         collect_modules(module_tree, parent_path)
-        return processing_order
+        return leaves, parents
 
     def is_leaf_module(self, module_info: Dict[str, Any]) -> bool:
         """Check if a module is a leaf module (has no children or empty children)."""
@@ -98,25 +234,33 @@ class DocumentationGenerator:
 
     def build_overview_structure(self, module_tree: Dict[str, Any], module_path: List[str],
                                  working_dir: str) -> Dict[str, Any]:
-        """Build structure for overview generation with 1-depth children docs and target indicator."""
-        
-        processed_module_tree = deepcopy(module_tree)
+        """Build structure for overview generation with 1-depth children docs and target indicator.
+
+        Only the dicts on the path to the target and its direct children are copied;
+        every other subtree is shared with ``module_tree`` and must not be mutated.
+        """
+        processed_module_tree = dict(module_tree)
         module_info = processed_module_tree
         for path_part in module_path:
+            module_info[path_part] = dict(module_info[path_part])
             module_info = module_info[path_part]
             if path_part != module_path[-1]:
-                module_info = module_info.get("children", {})
+                module_info["children"] = dict(module_info.get("children", {}))
+                module_info = module_info["children"]
             else:
                 module_info["is_target_for_overview_generation"] = True
 
         if "children" in module_info:
+            module_info["children"] = dict(module_info["children"])
             module_info = module_info["children"]
 
         for child_name, child_info in module_info.items():
-            if os.path.exists(os.path.join(working_dir, f"{child_name}.md")):
-                child_info["docs"] = file_manager.load_text(os.path.join(working_dir, f"{child_name}.md"))
-            else:
-                logger.warning(f"Module docs not found at {os.path.join(working_dir, f"{child_name}.md")}")
+            child_info = module_info[child_name] = dict(child_info)
+            child_docs_path = os.path.join(working_dir, f"{child_name}.md")
+            try:
+                child_info["docs"] = file_manager.load_text(child_docs_path)
+            except FileNotFoundError:
+                logger.warning(f"Module docs not found at {child_docs_path}")
                 child_info["docs"] = ""
 
         return processed_module_tree
@@ -129,57 +273,33 @@ class DocumentationGenerator:
 
         module_tree_path = os.path.join(working_dir, MODULE_TREE_FILENAME)
         first_module_tree_path = os.path.join(working_dir, FIRST_MODULE_TREE_FILENAME)
-        module_tree = file_manager.load_json(module_tree_path)
-        first_module_tree = file_manager.load_json(first_module_tree_path)
+        module_tree = self._load_module_tree(module_tree_path)
+        first_module_tree = self._load_module_tree(first_module_tree_path)
         
         # Get processing order (leaf modules first)
-        processing_order = self.get_processing_order(first_module_tree)
-
+        leaves, parents = self.get_processing_order(first_module_tree)
+
+        # Re-document only modules affected by changes since the previous run
+        self._invalidate_affected_docs(first_module_tree, leaves, parents, working_dir)
+
+        # Drop leaf modules whose docs already exist (e.g. resuming after a partial run)
+        # so the loop below never sees them. Parents are kept: generate_parent_module_docs
+        # skips them unless their children's docs changed since they were generated.
+        existing_docs = {entry.name for entry in os.scandir(working_dir) if entry.name.endswith(".md")}
+        pending_leaves = [leaf for leaf in leaves if f"{leaf[1]}.md" not in existing_docs]
+        if len(pending_leaves) < len(leaves):
+            logger.info(f"✓ Skipping {len(leaves) - len(pending_leaves)} leaf modules with existing docs")
+
+        # Child docs digests recorded by a previous run
+        metadata = file_manager.load_json(os.path.join(working_dir, "metadata.json")) or {}
+        self._child_hashes = dict(metadata.get("child_hashes", {}))
         
         # Process modules in dependency order
         final_module_tree = module_tree
-        processed_modules = set()
 
         if len(module_tree) > 0:
-            for module_path, module_name in processing_order:
-                try:
-                    # Get the module info from the tree
-                    module_info = module_tree
-                    for path_part in module_path:
-                        module_info = module_info[path_part]
-                        if path_part != module_path[-1]:  # Not the last part
-                            module_info = module_info.get("children", {})
-                    
-                    # Skip if already processed
-                    module_key = "/".join(module_path)
-                    if module_key in processed_modules:
-                        continue
-                    
-                    # Process the module
-                    if self.is_leaf_module(module_info):
-                        logger.info(f"📄 Processing leaf module: {module_key}")
-                        if self.config.use_claude_code:
-                            # Use Claude Code CLI for documentation generation
-                            final_module_tree = await self._process_module_with_claude_code(
-                                module_name, components, module_info["components"],
-                                module_tree, working_dir
-                            )
-                        else:
-                            final_module_tree = await self.agent_orchestrator.process_module(
-                                module_name, components, module_info["components"], module_path, working_dir
-                            )
-                    else:
-                        logger.info(f"📁 Processing parent module: {module_key}")
-                        final_module_tree = await self.generate_parent_module_docs(
-                            module_path, working_dir
-                        )
-                    
-                    processed_modules.add(module_key)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to process module {module_key}: {str(e)}")
-                    logger.error(f"Traceback: {traceback.format_exc()}")
-                    continue
+            await self._process_leaf_modules(pending_leaves, components, module_tree, working_dir)
+            await self._process_parent_modules(parents, working_dir)
 
             # Generate repo overview
             logger.info(f"📚 Generating repository overview")
@@ -194,31 +314,103 @@ class DocumentationGenerator:
                 final_module_tree = await self._process_module_with_claude_code(
                     repo_name, components, leaf_nodes, module_tree, working_dir
                 )
+            elif self.config.use_gemini_code:
+                # Use Gemini CLI for documentation generation
+                final_module_tree = await self._process_module_with_gemini_code(
+                    repo_name, components, leaf_nodes, module_tree, working_dir
+                )
             else:
                 final_module_tree = await self.agent_orchestrator.process_module(
                     repo_name, components, leaf_nodes, [], working_dir
                 )
 
+            await self._flush_pending_writes()
+
             # save final_module_tree to module_tree.json
-            file_manager.save_json(final_module_tree, os.path.join(working_dir, MODULE_TREE_FILENAME))
+            self._save_module_tree(final_module_tree, os.path.join(working_dir, MODULE_TREE_FILENAME))
 
             # rename repo_name.md to overview.md
             repo_overview_path = os.path.join(working_dir, f"{repo_name}.md")
             if os.path.exists(repo_overview_path):
                 os.rename(repo_overview_path, os.path.join(working_dir, OVERVIEW_FILENAME))
         
+        await self._flush_pending_writes()
+
+        # Docs now reflect the current graph; make it the next run's diff baseline
+        self.graph_builder.save_documented_graph()
         return working_dir
 
+    async def _process_leaf_modules(self, leaves: List[Tuple[List[str], str, List[str]]],
+                                    components: Dict[str, Any], module_tree: Dict[str, Any],
+                                    working_dir: str) -> None:
+        """Generate documentation for leaf modules."""
+        if self.config.use_gemini_code:
+            await self._process_leaf_modules_with_gemini_code(leaves, components, module_tree, working_dir)
+            return
+
+        for module_path, module_name, component_ids in leaves:
+            module_key = "/".join(module_path)
+            try:
+                logger.info(f"📄 Processing leaf module: {module_key}")
+                if self.config.use_claude_code:
+                    # Use Claude Code CLI for documentation generation
+                    await self._process_module_with_claude_code(
+                        module_name, components, component_ids, module_tree, working_dir
+                    )
+                else:
+                    await self.agent_orchestrator.process_module(
+                        module_name, components, component_ids, module_path, working_dir
+                    )
+            except Exception as e:
+                logger.exception("Failed to process module %s: %s", module_key, e)
+
+    async def _process_leaf_modules_with_gemini_code(self, leaves: List[Tuple[List[str], str, List[str]]],
+                                                     components: Dict[str, Any], module_tree: Dict[str, Any],
+                                                     working_dir: str) -> None:
+        """Generate documentation for leaf modules with Gemini CLI, at most gemini_code_concurrency at a time.
+
+        Leaf modules are independent of each other, so their CLI invocations can
+        overlap; parent modules still run afterwards in post-order.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.config.gemini_code_concurrency))
+
+        async def process_leaf(module_path: List[str], module_name: str, component_ids: List[str]) -> None:
+            module_key = "/".join(module_path)
+            async with semaphore:
+                try:
+                    logger.info(f"📄 Processing leaf module: {module_key}")
+                    await self._process_module_with_gemini_code(
+                        module_name, components, component_ids, module_tree, working_dir
+                    )
+                except Exception as e:
+                    logger.exception("Failed to process module %s: %s", module_key, e)
+
+        await asyncio.gather(*(process_leaf(*leaf) for leaf in leaves))
+
+    async def _process_parent_modules(self, parents: List[Tuple[List[str], str]],
+                                      working_dir: str) -> None:
+        """Generate documentation for parent modules."""
+        for module_path, module_name in parents:
+            module_key = "/".join(module_path)
+            try:
+                logger.info(f"📁 Processing parent module: {module_key}")
+                await self.generate_parent_module_docs(module_path, working_dir)
+            except Exception as e:
+                logger.exception("Failed to process module %s: %s", module_key, e)
+
     async def generate_parent_module_docs(self, module_path: List[str], 
                                         working_dir: str) -> Dict[str, Any]:
         """Generate documentation for a parent module based on its children's documentation."""
+        # Children docs must be on disk before the overview structure reads them
+        await self._flush_pending_writes()
+
         module_name = module_path[-1] if len(module_path) >= 1 else os.path.basename(os.path.normpath(self.config.repo_path))
 
         logger.info(f"Generating parent documentation for: {module_name}")
         
         # Load module tree
         module_tree_path = os.path.join(working_dir, MODULE_TREE_FILENAME)
-        module_tree = file_manager.load_json(module_tree_path)
+        module_tree = self._load_module_tree(module_tree_path)
 
         # check if overview docs already exists
         overview_docs_path = os.path.join(working_dir, OVERVIEW_FILENAME)
@@ -226,19 +418,24 @@ class DocumentationGenerator:
             logger.info(f"✓ Overview docs already exists at {overview_docs_path}")
             return module_tree
 
-        # check if parent docs already exists
+        # check if parent docs already exists and its children are unchanged
+        module_key = "/".join(module_path)
+        children_digest = self._child_docs_digest(module_tree, module_path, working_dir)
         parent_docs_path = os.path.join(working_dir, f"{module_name if len(module_path) >= 1 else OVERVIEW_FILENAME.replace('.md', '')}.md")
         if os.path.exists(parent_docs_path):
-            logger.info(f"✓ Parent docs already exists at {parent_docs_path}")
-            return module_tree
+            previous_digest = self._child_hashes.setdefault(module_key, children_digest)
+            if previous_digest == children_digest:
+                logger.info(f"✓ Parent docs already exists at {parent_docs_path}")
+                return module_tree
+            logger.info(f"Children docs of {module_name} changed, regenerating {parent_docs_path}")
 
         # Create repo structure with 1-depth children docs and target indicator
         repo_structure = self.build_overview_structure(module_tree, module_path, working_dir)
 
-        prompt = MODULE_OVERVIEW_PROMPT.format(
+        prompt = format_module_overview_prompt(
             module_name=module_name,
             repo_structure=json.dumps(repo_structure, indent=4)
-        ) if len(module_path) >= 1 else REPO_OVERVIEW_PROMPT.format(
+        ) if len(module_path) >= 1 else format_repo_overview_prompt(
             repo_name=module_name,
             repo_structure=json.dumps(repo_structure, indent=4)
         )
@@ -248,23 +445,24 @@ class DocumentationGenerator:
             if self.config.use_claude_code:
                 from codewiki.src.be.claude_code_adapter import claude_code_generate_overview
                 parent_docs = claude_code_generate_overview(prompt, self.config)
+            elif self.config.use_gemini_code:
+                from codewiki.src.be.gemini_code_adapter import gemini_code_generate_overview
+                parent_docs = gemini_code_generate_overview(prompt, self.config)
             else:
                 parent_docs = call_llm(prompt, self.config)
 
             # Parse and save parent documentation
-            if "<OVERVIEW>" in parent_docs and "</OVERVIEW>" in parent_docs:
-                parent_content = parent_docs.split("<OVERVIEW>")[1].split("</OVERVIEW>")[0].strip()
-            else:
-                # Claude Code might return the content directly without tags
-                parent_content = parent_docs.strip()
-            file_manager.save_text(parent_content, parent_docs_path)
+            # Claude Code might return the content directly without tags
+            match = _OVERVIEW_RE.search(parent_docs)
+            parent_content = (match.group(1) if match else parent_docs).strip()
+            self._save_text_async(parent_content, parent_docs_path)
+            self._child_hashes[module_key] = children_digest
 
             logger.debug(f"Successfully generated parent documentation for: {module_name}")
             return module_tree
 
         except Exception as e:
-            logger.error(f"Error generating parent documentation for {module_name}: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Error generating parent documentation for %s: %s", module_name, e)
             raise
 
     async def _process_module_with_claude_code(
@@ -313,14 +511,66 @@ class DocumentationGenerator:
                 logger.info(f"✓ Generated documentation for {module_name} (file created by Claude Code)")
             else:
                 # Claude returned documentation in stdout, save it
-                file_manager.save_text(doc_content, docs_path)
+                self._save_text_async(doc_content, docs_path)
+                logger.info(f"✓ Generated documentation for {module_name}")
+
+            return module_tree
+
+        except Exception as e:
+            logger.exception("Claude Code documentation generation failed for %s: %s", module_name, e)
+            raise
+
+    async def _process_module_with_gemini_code(
+        self,
+        module_name: str,
+        components: Dict[str, Any],
+        core_component_ids: List[str],
+        module_tree: Dict[str, Any],
+        working_dir: str,
+    ) -> Dict[str, Any]:
+        """
+        Process a module using Gemini CLI for documentation generation.
+
+        Args:
+            module_name: Name of the module
+            components: All code components
+            core_component_ids: Component IDs in this module
+            module_tree: The full module tree
+            working_dir: Output directory for documentation
+
+        Returns:
+            Updated module tree
+        """
+        from codewiki.src.be.gemini_code_adapter import gemini_code_generate_docs_async
+
+        # Check if docs already exist
+        docs_path = os.path.join(working_dir, f"{module_name}.md")
+        if os.path.exists(docs_path):
+            logger.info(f"✓ Module docs already exists at {docs_path}")
+            return module_tree
+
+        try:
+            # Generate documentation using Gemini CLI
+            doc_content = await gemini_code_generate_docs_async(
+                module_name=module_name,
+                core_component_ids=core_component_ids,
+                components=components,
+                module_tree=module_tree,
+                config=self.config,
+                output_path=working_dir,
+            )
+
+            # Gemini runs in YOLO mode and may already have written the file itself
+            if os.path.exists(docs_path):
+                logger.info(f"✓ Generated documentation for {module_name} (file created by Gemini CLI)")
+            else:
+                self._save_text_async(doc_content, docs_path)
                 logger.info(f"✓ Generated documentation for {module_name}")
 
             return module_tree
 
         except Exception as e:
-            logger.error(f"Claude Code documentation generation failed for {module_name}: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Gemini CLI documentation generation failed for %s: %s", module_name, e)
             raise
 
     async def run(self) -> None:
@@ -342,13 +592,13 @@ class DocumentationGenerator:
             # Check if module tree exists
             if os.path.exists(first_module_tree_path):
                 logger.debug(f"Module tree found at {first_module_tree_path}")
-                module_tree = file_manager.load_json(first_module_tree_path)
+                module_tree = self._load_module_tree(first_module_tree_path)
             else:
                 logger.debug(f"Module tree not found at {module_tree_path}, clustering modules")
                 module_tree = cluster_modules(leaf_nodes, components, self.config)
-                file_manager.save_json(module_tree, first_module_tree_path)
+                self._save_module_tree(module_tree, first_module_tree_path)
             
-            file_manager.save_json(module_tree, module_tree_path)
+            self._save_module_tree(module_tree, module_tree_path)
             
             logger.debug(f"Grouped components into {len(module_tree)} modules")
             
@@ -364,6 +614,5 @@ class DocumentationGenerator:
             logger.debug(f"Documentation saved to: {working_dir}")
             
         except Exception as e:
-            logger.error(f"Documentation generation failed: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Documentation generation failed: %s", e)
             raise
\ No newline at end of file
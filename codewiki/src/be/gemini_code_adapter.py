@@ -6,11 +6,16 @@ for module clustering and documentation generation.
 
 ## Usage
 
-The adapter invokes Gemini CLI in non-interactive mode with YOLO mode:
-    gemini -y "prompt"
+The adapter invokes Gemini CLI in non-interactive mode with YOLO approval,
+passing the prompt via stdin to handle large prompts:
+    echo "prompt" | gemini --approval-mode yolo --output-format text
 
-Or via stdin for large prompts:
-    echo "prompt" | gemini -y
+## Sandbox
+
+With `gemini_disable_sandbox` set, the CLI runs with `GEMINI_SANDBOX=false`,
+skipping per-invocation sandbox setup. Combined with YOLO approval this lets
+the model run tools directly on the host, so only enable it for trusted
+repositories in an already isolated environment (container, CI runner).
 
 ## Prompt Size Limits
 
@@ -24,24 +29,68 @@ if the prompt exceeds the configurable `max_prompt_tokens` limit (default: 900K
 
 - `GeminiCodeError`: Raised for all CLI failures (not found, timeout, exit code != 0, prompt too large)
 - Timeout: Configurable via `gemini_code_timeout` in config (default: 600s)
+
+## Backend Coverage
+
+With `use_gemini_code`, `DocumentationGenerator` runs every LLM step through the
+Gemini CLI, as it already does for `use_claude_code`: module clustering, leaf module
+docs, parent module docs and the repository overview. Earlier versions used the CLI
+for clustering only and generated docs through the configured LLM API.
+
+## Concurrency
+
+`gemini_code_generate_docs_async` runs the CLI through `asyncio.create_subprocess_exec`,
+so callers can document several modules at once with `asyncio.gather`. Callers bound
+the fan-out with `gemini_code_concurrency` in config (default: 4). Prompt building and
+tokenization run in worker threads so they don't serialize the fan-out.
+
+## Response Cache
+
+With `gemini_cache_enabled` set, clustering and overview responses are stored under
+`gemini_cache/` in the configured output directory, keyed by the SHA-256 of the prompt,
+CLI path and working directory, so unchanged prompts skip the CLI entirely. A response is
+only cached once the caller has accepted it (a clustering response that parses, an overview
+wrapped in <OVERVIEW> tags). `gemini_cache_ttl` (seconds) expires entries;
+`get_cache_stats()` reports hits and misses.
+
+Module documentation is never cached: in YOLO mode the CLI may write the docs file itself
+and print only a confirmation, and a module's prompt doesn't change when only the modules
+it depends on do.
 """
 
+import ast
+import asyncio
+import functools
+import hashlib
 import json
 import logging
+import os
+import re
 import shutil
+import signal
 import subprocess
-from typing import Any, Dict, List, Optional
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from codewiki.src.be.dependency_analyzer.models.core import Node
 from codewiki.src.be.prompt_template import (
     CLUSTER_REPO_PROMPT,
     CLUSTER_MODULE_PROMPT,
     format_user_prompt,
-    format_system_prompt,
-    format_leaf_system_prompt,
+    format_system_prompt_parts,
 )
 from codewiki.src.be.cluster_modules import format_potential_core_components
-from codewiki.src.be.utils import is_complex_module
+from codewiki.src.be.utils import count_tokens, is_complex_module
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # optional speedup for large clustering responses
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +102,36 @@ DEFAULT_GEMINI_CODE_TIMEOUT = 600
 # Setting to 900K to leave room for response
 DEFAULT_MAX_PROMPT_TOKENS = 900_000
 
+# Default number of concurrent Gemini CLI invocations for documentation generation
+DEFAULT_GEMINI_CODE_CONCURRENCY = 4
+
+# Token budget and module count per batched documentation call
+DEFAULT_BATCH_TOKENS = 800_000
+DEFAULT_BATCH_SIZE = 8
+
+# Sentinels delimiting each module's documentation in a batched response
+_BATCH_DOC_RE = re.compile(r'<<<DOC name="(.+?)">>>\n?(.*?)\n?<<<END name="\1">>>', re.DOTALL)
+
+# Pipe buffer size for streaming CLI output
+_PIPE_BUFSIZE = 1 << 16
+
+# Gemini CLI log lines mixed into stdout, filtered out of responses
+_SKIP_PREFIXES = (
+    'YOLO mode',
+    'Loaded cached',
+    'Loading extension',
+    'Initializing',
+    'Connected to',
+)
+
+# Response cache location (relative to the configured output directory) and size limit
+GEMINI_CACHE_DIR = "gemini_cache"
+# Prompts above this size are not cached to keep the cache directory small
+DEFAULT_CACHE_MAX_PROMPT_TOKENS = 200_000
+
+_cache_stats = {"hits": 0, "misses": 0}
+_cache_stats_lock = threading.Lock()
+
 
 class GeminiCodeError(Exception):
     """Exception raised when Gemini CLI invocation fails."""
@@ -63,10 +142,14 @@ class GeminiCodeError(Exception):
         self.stderr = stderr
 
 
+@functools.lru_cache(maxsize=8)
 def _find_gemini_cli(config_path: Optional[str] = None) -> str:
     """
     Find the Gemini CLI executable.
 
+    Lookups are cached per process; failures are not cached. Call
+    `_find_gemini_cli.cache_clear()` after installing or moving the CLI.
+
     Args:
         config_path: Optional configured path to gemini CLI
 
@@ -93,32 +176,24 @@ def _find_gemini_cli(config_path: Optional[str] = None) -> str:
     )
 
 
-def _invoke_gemini_code(
-    prompt: str,
-    timeout: int = DEFAULT_GEMINI_CODE_TIMEOUT,
-    gemini_code_path: Optional[str] = None,
-    working_dir: Optional[str] = None,
-    max_prompt_tokens: int = DEFAULT_MAX_PROMPT_TOKENS,
-) -> str:
+def _check_prompt_size(prompt: str, max_prompt_tokens: int) -> int:
     """
-    Invoke Gemini CLI with a prompt and return the output.
+    Log the prompt size and reject prompts over the configured limit.
 
     Args:
         prompt: The prompt to send to Gemini
-        timeout: Timeout in seconds (default: 600)
-        gemini_code_path: Optional path to gemini CLI executable
-        working_dir: Optional working directory for the subprocess
-        max_prompt_tokens: Maximum allowed prompt size in estimated tokens (default: 900K)
+        max_prompt_tokens: Maximum allowed prompt size in estimated tokens
 
     Returns:
-        The stdout output from Gemini CLI
+        The estimated prompt size in tokens
 
     Raises:
-        GeminiCodeError: If CLI invocation fails or prompt exceeds size limit
+        GeminiCodeError: If the prompt exceeds the size limit
     """
     # Calculate prompt size metrics first
     prompt_chars = len(prompt)
-    prompt_tokens_estimate = prompt_chars // 4  # Rough estimate: ~4 chars per token
+    # Tokenize locally (cl100k); Gemini's tokenizer differs, but far less than chars // 4 on code
+    prompt_tokens_estimate = count_tokens(prompt)
 
     logger.info(f"Prompt size: {prompt_chars:,} chars (~{prompt_tokens_estimate:,} tokens estimated)")
 
@@ -137,47 +212,278 @@ def _invoke_gemini_code(
             f"({prompt_tokens_estimate * 100 // max_prompt_tokens}% of {max_prompt_tokens:,} limit)"
         )
 
-    cli_path = _find_gemini_cli(gemini_code_path)
+    return prompt_tokens_estimate
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """Return a snapshot of response cache hits and misses."""
+    with _cache_stats_lock:
+        return dict(_cache_stats)
+
+
+def _record_cache(event: str) -> None:
+    with _cache_stats_lock:
+        _cache_stats[event] += 1
+
+
+def _get_cache_dir(config: Any) -> Optional[str]:
+    """Return the response cache directory, or None if caching is disabled."""
+    if not getattr(config, "gemini_cache_enabled", False):
+        return None
+    # Kept with CodeWiki's own output, never inside the repository being documented
+    output_dir = getattr(config, "output_dir", None)
+    if not output_dir:
+        return None
+    return os.path.abspath(os.path.join(output_dir, GEMINI_CACHE_DIR))
+
+
+def _cache_key(prompt: str, cli_path: str, working_dir: Optional[str]) -> str:
+    """Content-addressed cache key for a CLI invocation."""
+    hasher = hashlib.sha256()
+    for part in (prompt, cli_path, working_dir or ""):
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
 
-    # Build command - use -y for YOLO mode (auto-approve all actions)
+
+def _cache_path(
+    prompt: str,
+    prompt_tokens_estimate: int,
+    cli_path: str,
+    working_dir: Optional[str],
+    cache_dir: Optional[str],
+) -> Optional[str]:
+    """Return the cache file for this invocation, or None if it should not be cached."""
+    if not cache_dir or prompt_tokens_estimate > DEFAULT_CACHE_MAX_PROMPT_TOKENS:
+        return None
+    return os.path.join(cache_dir, _cache_key(prompt, cli_path, working_dir))
+
+
+def _cache_read(path: Optional[str], ttl: Optional[int]) -> Optional[str]:
+    """Return a cached response if present and not expired."""
+    if path is None:
+        return None
+    try:
+        if ttl is not None and time.time() - os.path.getmtime(path) > ttl:
+            _record_cache("misses")
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            response = f.read()
+    except FileNotFoundError:
+        _record_cache("misses")
+        return None
+    _record_cache("hits")
+    logger.info("Gemini CLI response served from cache")
+    return response
+
+
+def _cache_write(path: Optional[str], response: str) -> None:
+    """Atomically persist a response to the cache."""
+    if path is None:
+        return
+    try:
+        cache_dir = os.path.dirname(path)
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(response)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"Failed to write Gemini response cache: {e}")
+
+
+def _build_command(cli_path: str) -> List[str]:
+    """Build the Gemini CLI command line."""
+    # Use --approval-mode yolo to auto-approve all actions
     # Use --output-format text for clean output
     # Prompt is passed via stdin to handle large prompts
-    cmd = [cli_path, "-y", "--output-format", "text"]
+    return [cli_path, "--approval-mode", "yolo", "--output-format", "text"]
+
+
+def _build_env(disable_sandbox: bool) -> Optional[Dict[str, str]]:
+    """Build the CLI environment; None inherits ours unchanged."""
+    if not disable_sandbox:
+        return None
+    return {**os.environ, "GEMINI_SANDBOX": "false"}
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode CLI output the way the text-mode pipes of `_run_streaming` do (universal newlines)."""
+    return data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _filter_output(stdout: str) -> str:
+    """Filter out Gemini CLI log lines from stdout."""
+    output_lines = stdout.split('\n')
+    filtered_lines = [line for line in output_lines if not line.startswith(_SKIP_PREFIXES)]
+    return '\n'.join(filtered_lines)
+
+
+def _kill_process_tree(proc: Any) -> None:
+    """
+    Kill the CLI and every process it started.
+
+    In YOLO mode the CLI runs shell and tool subprocesses that inherit its stdout;
+    killing only the CLI would leave them holding the pipe open. The CLI is started
+    in its own session, so its process group is exactly that tree.
+    """
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass  # the whole group already exited
+        return
+    proc.kill()
+
+
+def _run_streaming(
+    cmd: List[str],
+    prompt: str,
+    timeout: int,
+    working_dir: Optional[str],
+    env: Optional[Dict[str, str]] = None,
+) -> Tuple[int, str, str]:
+    """
+    Run the CLI, filtering stdout line by line as it arrives.
+
+    The prompt is written and stderr drained on helper threads so neither pipe
+    can fill up and deadlock the child; a timer kills the child and everything
+    it started on timeout, which closes the pipes and ends the read loop.
+
+    Returns:
+        Tuple of (returncode, filtered stdout, stderr)
+
+    Raises:
+        subprocess.TimeoutExpired: If the CLI runs longer than timeout
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",  # same decoding as the async path, regardless of locale
+        errors="replace",
+        bufsize=_PIPE_BUFSIZE,
+        cwd=working_dir,
+        env=env,
+        start_new_session=True,  # own process group, see _kill_process_tree
+    )
+
+    def _feed_prompt():
+        try:
+            proc.stdin.write(prompt)  # Pass prompt via stdin
+            proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass  # CLI exited early; its exit code tells the story
+
+    stderr_chunks: List[str] = []
+    timed_out = threading.Event()
+
+    def _kill():
+        timed_out.set()
+        _kill_process_tree(proc)
+
+    timer = threading.Timer(timeout, _kill)
+    writer = threading.Thread(target=_feed_prompt, daemon=True)
+    stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+    timer.start()
+    writer.start()
+    stderr_reader.start()
+
+    try:
+        filtered_lines = []
+        ends_with_newline = True
+        for line in proc.stdout:
+            ends_with_newline = line.endswith('\n')
+            if ends_with_newline:
+                line = line[:-1]
+            if not line.startswith(_SKIP_PREFIXES):
+                filtered_lines.append(line)
+        # Match str.split('\n'), which yields a trailing empty line
+        if ends_with_newline:
+            filtered_lines.append('')
+
+        proc.wait()
+        writer.join()
+        stderr_reader.join()
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            _kill_process_tree(proc)
+            proc.wait()
+        proc.stdout.close()
+        proc.stderr.close()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+
+    return proc.returncode, '\n'.join(filtered_lines), ''.join(stderr_chunks)
+
+
+def _invoke_gemini_code(
+    prompt: str,
+    timeout: int = DEFAULT_GEMINI_CODE_TIMEOUT,
+    gemini_code_path: Optional[str] = None,
+    working_dir: Optional[str] = None,
+    max_prompt_tokens: int = DEFAULT_MAX_PROMPT_TOKENS,
+    cache_dir: Optional[str] = None,
+    cache_ttl: Optional[int] = None,
+    disable_sandbox: bool = False,
+    cacheable: Optional[Callable[[str], bool]] = None,
+) -> str:
+    """
+    Invoke Gemini CLI with a prompt and return the output.
+
+    Args:
+        prompt: The prompt to send to Gemini
+        timeout: Timeout in seconds (default: 600)
+        gemini_code_path: Optional path to gemini CLI executable
+        working_dir: Optional working directory for the subprocess
+        max_prompt_tokens: Maximum allowed prompt size in estimated tokens (default: 900K)
+        cache_dir: Optional response cache directory (disabled when None)
+        cache_ttl: Optional cache entry lifetime in seconds (no expiry when None)
+        disable_sandbox: Run the CLI without its sandbox (see module docs)
+        cacheable: Predicate the caller uses to accept a response before it is
+            cached; without it the cache is bypassed entirely
+
+    Returns:
+        The stdout output from Gemini CLI
+
+    Raises:
+        GeminiCodeError: If CLI invocation fails or prompt exceeds size limit
+    """
+    prompt_tokens_estimate = _check_prompt_size(prompt, max_prompt_tokens)
+
+    cli_path = _find_gemini_cli(gemini_code_path)
+    cache_path = None
+    if cacheable is not None:
+        cache_path = _cache_path(prompt, prompt_tokens_estimate, cli_path, working_dir, cache_dir)
+    cached = _cache_read(cache_path, cache_ttl)
+    if cached is not None:
+        return cached
+
+    cmd = _build_command(cli_path)
 
     logger.info(f"Invoking Gemini CLI: {cli_path}")
 
     try:
-        result = subprocess.run(
-            cmd,
-            input=prompt,  # Pass prompt via stdin
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=working_dir,
-        )
+        returncode, response, stderr = _run_streaming(cmd, prompt, timeout, working_dir, _build_env(disable_sandbox))
 
-        if result.returncode != 0:
+        if returncode != 0:
             raise GeminiCodeError(
-                f"Gemini CLI returned non-zero exit code: {result.returncode}",
-                returncode=result.returncode,
-                stderr=result.stderr,
+                f"Gemini CLI returned non-zero exit code: {returncode}",
+                returncode=returncode,
+                stderr=stderr,
             )
 
-        # Filter out Gemini CLI log lines from stdout
-        output_lines = result.stdout.split('\n')
-        filtered_lines = []
-        skip_prefixes = (
-            'YOLO mode',
-            'Loaded cached',
-            'Loading extension',
-            'Initializing',
-            'Connected to',
-        )
-        for line in output_lines:
-            if not any(line.startswith(prefix) for prefix in skip_prefixes):
-                filtered_lines.append(line)
-
-        return '\n'.join(filtered_lines)
+        if cache_path is not None and cacheable(response):
+            _cache_write(cache_path, response)
+        return response
 
     except subprocess.TimeoutExpired:
         raise GeminiCodeError(f"Gemini CLI timed out after {timeout} seconds")
@@ -189,6 +495,136 @@ def _invoke_gemini_code(
         raise GeminiCodeError(f"Failed to invoke Gemini CLI: {str(e)}")
 
 
+async def _invoke_gemini_code_async(
+    prompt: str,
+    timeout: int = DEFAULT_GEMINI_CODE_TIMEOUT,
+    gemini_code_path: Optional[str] = None,
+    working_dir: Optional[str] = None,
+    max_prompt_tokens: int = DEFAULT_MAX_PROMPT_TOKENS,
+    disable_sandbox: bool = False,
+) -> str:
+    """
+    Invoke Gemini CLI with a prompt without blocking the event loop.
+
+    Same contract as `_invoke_gemini_code`, but the subprocess is driven by
+    asyncio so several invocations can run concurrently. Only used for module
+    documentation, so responses are never cached (see module docs).
+
+    Args:
+        prompt: The prompt to send to Gemini
+        timeout: Timeout in seconds (default: 600)
+        gemini_code_path: Optional path to gemini CLI executable
+        working_dir: Optional working directory for the subprocess
+        max_prompt_tokens: Maximum allowed prompt size in estimated tokens (default: 900K)
+        disable_sandbox: Run the CLI without its sandbox (see module docs)
+
+    Returns:
+        The stdout output from Gemini CLI
+
+    Raises:
+        GeminiCodeError: If CLI invocation fails or prompt exceeds size limit
+    """
+    # Tokenizing a large prompt takes a while; keep it off the event loop
+    await asyncio.to_thread(_check_prompt_size, prompt, max_prompt_tokens)
+
+    cli_path = _find_gemini_cli(gemini_code_path)
+    cmd = _build_command(cli_path)
+
+    logger.info(f"Invoking Gemini CLI: {cli_path}")
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=working_dir,
+            env=_build_env(disable_sandbox),
+            start_new_session=True,  # own process group, see _kill_process_tree
+        )
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(prompt.encode("utf-8")),  # Pass prompt via stdin
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            _kill_process_tree(proc)
+            await proc.wait()
+            raise GeminiCodeError(f"Gemini CLI timed out after {timeout} seconds")
+
+        if proc.returncode != 0:
+            raise GeminiCodeError(
+                f"Gemini CLI returned non-zero exit code: {proc.returncode}",
+                returncode=proc.returncode,
+                stderr=_decode_output(stderr),
+            )
+
+        return _filter_output(_decode_output(stdout))
+
+    except FileNotFoundError:
+        raise GeminiCodeError(f"Gemini CLI executable not found: {cli_path}")
+    except GeminiCodeError:
+        raise  # Re-raise our own exceptions as-is
+    except Exception as e:
+        raise GeminiCodeError(f"Failed to invoke Gemini CLI: {str(e)}")
+
+
+def _format_tree(tree: Dict[str, Any], current_module_name: Optional[str], indent: int = 0) -> Iterator[str]:
+    """Yield the lines of a module tree outline for the clustering prompt."""
+    pad = "  " * indent
+    child_pad = pad + "  "
+    for key, value in tree.items():
+        if key == current_module_name:
+            yield f"{pad}{key} (current module)"
+        else:
+            yield f"{pad}{key}"
+        yield f"{child_pad} Core components: {', '.join(value.get('components', []))}"
+        children = value.get("children", {})
+        if isinstance(children, dict) and len(children) > 0:
+            yield f"{child_pad} Children:"
+            yield from _format_tree(children, current_module_name, indent + 2)
+
+
+def _parse_cluster_response(response: str) -> Dict[str, Any]:
+    """
+    Parse a clustering response into a module tree.
+
+    Raises:
+        ValueError, SyntaxError: If the response doesn't hold a module tree
+    """
+    # Expect JSON wrapped in <GROUPED_COMPONENTS> tags
+    # Be more flexible: try to find JSON even if closing tag is missing
+    if "<GROUPED_COMPONENTS>" in response:
+        # Extract content after opening tag
+        response_content = response.split("<GROUPED_COMPONENTS>")[1]
+        # Try to find closing tag, but if not present, use the rest
+        if "</GROUPED_COMPONENTS>" in response_content:
+            response_content = response_content.split("</GROUPED_COMPONENTS>")[0]
+        # Clean up any trailing text after the JSON
+        response_content = response_content.strip()
+    else:
+        # Try to find raw JSON in response
+        response_content = response.strip()
+
+    # Try to parse as JSON first, fall back to a Python literal
+    try:
+        module_tree = _json_loads(response_content)
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
+        # Python dict literals (single quotes, True/None); never executes code
+        module_tree = ast.literal_eval(response_content)
+
+    if not isinstance(module_tree, dict):
+        raise ValueError(f"Invalid module tree format - expected dict, got {type(module_tree)}")
+
+    # Normalize module tree: ensure each module has 'children' key for compatibility
+    for module_name, module_info in module_tree.items():
+        if "children" not in module_info:
+            module_info["children"] = {}
+
+    return module_tree
+
+
 def gemini_code_cluster(
     leaf_nodes: List[str],
     components: Dict[str, Node],
@@ -223,22 +659,7 @@ def gemini_code_cluster(
         prompt = CLUSTER_REPO_PROMPT.format(potential_core_components=potential_core_components)
     else:
         # Format the module tree for context
-        lines = []
-
-        def _format_tree(tree: Dict[str, Any], indent: int = 0):
-            for key, value in tree.items():
-                if key == current_module_name:
-                    lines.append(f"{'  ' * indent}{key} (current module)")
-                else:
-                    lines.append(f"{'  ' * indent}{key}")
-                lines.append(f"{'  ' * (indent + 1)} Core components: {', '.join(value.get('components', []))}")
-                children = value.get("children", {})
-                if isinstance(children, dict) and len(children) > 0:
-                    lines.append(f"{'  ' * (indent + 1)} Children:")
-                    _format_tree(children, indent + 2)
-
-        _format_tree(current_module_tree, 0)
-        formatted_module_tree = "\n".join(lines)
+        formatted_module_tree = "\n".join(_format_tree(current_module_tree, current_module_name))
 
         prompt = CLUSTER_MODULE_PROMPT.format(
             potential_core_components=potential_core_components,
@@ -250,76 +671,55 @@ def gemini_code_cluster(
     timeout = getattr(config, "gemini_code_timeout", DEFAULT_GEMINI_CODE_TIMEOUT)
     gemini_path = getattr(config, "gemini_code_path", None)
 
-    # Invoke Gemini CLI
-    logger.info("Invoking Gemini CLI for module clustering...")
-    response = _invoke_gemini_code(prompt, timeout=timeout, gemini_code_path=gemini_path)
-
-    # Parse the response - expect JSON wrapped in <GROUPED_COMPONENTS> tags
-    # Be more flexible: try to find JSON even if closing tag is missing
-    try:
-        if "<GROUPED_COMPONENTS>" in response:
-            # Extract content after opening tag
-            response_content = response.split("<GROUPED_COMPONENTS>")[1]
-            # Try to find closing tag, but if not present, use the rest
-            if "</GROUPED_COMPONENTS>" in response_content:
-                response_content = response_content.split("</GROUPED_COMPONENTS>")[0]
-            # Clean up any trailing text after the JSON
-            response_content = response_content.strip()
-        else:
-            # Try to find raw JSON in response
-            logger.warning("No <GROUPED_COMPONENTS> tag found, attempting to parse raw JSON...")
-            response_content = response.strip()
+    # Outcome of parsing the response, filled in by the cache predicate when it
+    # runs (fresh responses with caching enabled) so the text is parsed only once
+    parsed: Dict[str, Any] = {}
 
-        # Try to parse as JSON first, fall back to eval
-        import json
+    def parse_response(text: str) -> None:
         try:
-            module_tree = json.loads(response_content)
-        except json.JSONDecodeError:
-            # Try eval as fallback (for Python dict literals)
-            module_tree = eval(response_content)
+            parsed["module_tree"] = _parse_cluster_response(text)
+        except Exception as e:
+            parsed["error"] = e
 
-        if not isinstance(module_tree, dict):
-            logger.error(f"Invalid module tree format - expected dict, got {type(module_tree)}")
-            return {}
+    def is_cluster_response(text: str) -> bool:
+        parse_response(text)
+        return bool(parsed.get("module_tree"))
 
-        # Normalize module tree: ensure each module has 'children' key for compatibility
-        for module_name, module_info in module_tree.items():
-            if "children" not in module_info:
-                module_info["children"] = {}
+    # Invoke Gemini CLI
+    logger.info("Invoking Gemini CLI for module clustering...")
+    response = _invoke_gemini_code(
+        prompt,
+        timeout=timeout,
+        gemini_code_path=gemini_path,
+        cache_dir=_get_cache_dir(config),
+        cache_ttl=getattr(config, "gemini_cache_ttl", None),
+        disable_sandbox=getattr(config, "gemini_disable_sandbox", False),
+        # Unparseable responses are not cached, so the next run asks again
+        cacheable=is_cluster_response,
+    )
 
-        return module_tree
+    if "<GROUPED_COMPONENTS>" not in response:
+        logger.warning("No <GROUPED_COMPONENTS> tag found, attempting to parse raw JSON...")
 
-    except Exception as e:
-        logger.error(f"Failed to parse Gemini clustering response: {e}")
+    if not parsed:
+        # Cache hit or caching disabled: the predicate never saw this response
+        parse_response(response)
+
+    if "error" in parsed:
+        logger.error(f"Failed to parse Gemini clustering response: {parsed['error']}")
         logger.error(f"Response: {response[:500]}...")
         return {}
+    return parsed["module_tree"]
 
 
-def gemini_code_generate_docs(
+def _build_module_prompts(
     module_name: str,
     core_component_ids: List[str],
     components: Dict[str, Node],
     module_tree: Dict[str, Any],
     config: Any,
-    output_path: str,
-) -> str:
-    """
-    Generate documentation for a module using Gemini CLI.
-
-    Args:
-        module_name: Name of the module to document
-        core_component_ids: List of component IDs in this module
-        components: Dictionary mapping component IDs to Node objects
-        module_tree: The full module tree for context
-        config: Configuration object
-        output_path: Path where documentation should be saved
-
-    Returns:
-        The generated markdown documentation
-
-    Raises:
-        GeminiCodeError: If documentation generation fails
-    """
+) -> Tuple[str, str]:
+    """Build the (system prompt, user prompt) pair for documenting a module."""
     # Determine if this is a complex or leaf module
     is_complex = is_complex_module(components, core_component_ids)
 
@@ -328,11 +728,12 @@ def gemini_code_generate_docs(
     if hasattr(config, "get_prompt_addition"):
         custom_instructions = config.get_prompt_addition()
 
-    # Build system prompt based on complexity
-    if is_complex:
-        system_prompt = format_system_prompt(module_name, custom_instructions)
-    else:
-        system_prompt = format_leaf_system_prompt(module_name, custom_instructions)
+    # Build system prompt based on complexity. The static part goes first and is
+    # identical across modules, so the provider can cache the shared prefix.
+    static_prefix, session_context = format_system_prompt_parts(
+        module_name, custom_instructions, leaf=not is_complex
+    )
+    system_prompt = f"{static_prefix}\n\n---\n\n{session_context}"
 
     # Build user prompt with module context
     user_prompt = format_user_prompt(
@@ -342,8 +743,24 @@ def gemini_code_generate_docs(
         module_tree=module_tree,
     )
 
+    return system_prompt, user_prompt
+
+
+def _build_docs_prompt(
+    module_name: str,
+    core_component_ids: List[str],
+    components: Dict[str, Node],
+    module_tree: Dict[str, Any],
+    config: Any,
+    output_path: str,
+) -> str:
+    """Build the full documentation prompt for a module."""
+    system_prompt, user_prompt = _build_module_prompts(
+        module_name, core_component_ids, components, module_tree, config
+    )
+
     # Combine into full prompt for Gemini CLI
-    full_prompt = f"""You are a documentation assistant. Follow these instructions:
+    return f"""You are a documentation assistant. Follow these instructions:
 
 {system_prompt}
 
@@ -357,6 +774,36 @@ IMPORTANT: Output ONLY the markdown documentation content. Do not wrap in code b
 Save the documentation to: {output_path}/{module_name}.md
 """
 
+
+def gemini_code_generate_docs(
+    module_name: str,
+    core_component_ids: List[str],
+    components: Dict[str, Node],
+    module_tree: Dict[str, Any],
+    config: Any,
+    output_path: str,
+) -> str:
+    """
+    Generate documentation for a module using Gemini CLI.
+
+    Args:
+        module_name: Name of the module to document
+        core_component_ids: List of component IDs in this module
+        components: Dictionary mapping component IDs to Node objects
+        module_tree: The full module tree for context
+        config: Configuration object
+        output_path: Path where documentation should be saved
+
+    Returns:
+        The generated markdown documentation
+
+    Raises:
+        GeminiCodeError: If documentation generation fails
+    """
+    full_prompt = _build_docs_prompt(
+        module_name, core_component_ids, components, module_tree, config, output_path
+    )
+
     # Get timeout and path from config
     timeout = getattr(config, "gemini_code_timeout", DEFAULT_GEMINI_CODE_TIMEOUT)
     gemini_path = getattr(config, "gemini_code_path", None)
@@ -369,11 +816,198 @@ Save the documentation to: {output_path}/{module_name}.md
         timeout=timeout,
         gemini_code_path=gemini_path,
         working_dir=repo_path,
+        disable_sandbox=getattr(config, "gemini_disable_sandbox", False),
     )
 
     return response
 
 
+async def gemini_code_generate_docs_async(
+    module_name: str,
+    core_component_ids: List[str],
+    components: Dict[str, Node],
+    module_tree: Dict[str, Any],
+    config: Any,
+    output_path: str,
+) -> str:
+    """
+    Generate documentation for a module using Gemini CLI, without blocking the event loop.
+
+    Mirrors `gemini_code_generate_docs`. Callers fanning out over many modules
+    should bound concurrency with `gemini_code_concurrency` (e.g. an asyncio.Semaphore).
+
+    Args:
+        module_name: Name of the module to document
+        core_component_ids: List of component IDs in this module
+        components: Dictionary mapping component IDs to Node objects
+        module_tree: The full module tree for context
+        config: Configuration object
+        output_path: Path where documentation should be saved
+
+    Returns:
+        The generated markdown documentation
+
+    Raises:
+        GeminiCodeError: If documentation generation fails
+    """
+    # Formatting the module's code into the prompt is CPU-bound; keep it off the event loop
+    full_prompt = await asyncio.to_thread(
+        _build_docs_prompt, module_name, core_component_ids, components, module_tree, config, output_path
+    )
+
+    # Get timeout and path from config
+    timeout = getattr(config, "gemini_code_timeout", DEFAULT_GEMINI_CODE_TIMEOUT)
+    gemini_path = getattr(config, "gemini_code_path", None)
+    repo_path = getattr(config, "repo_path", None)
+
+    # Invoke Gemini CLI
+    logger.info(f"Invoking Gemini CLI for documentation: {module_name}")
+    response = await _invoke_gemini_code_async(
+        full_prompt,
+        timeout=timeout,
+        gemini_code_path=gemini_path,
+        working_dir=repo_path,
+        disable_sandbox=getattr(config, "gemini_disable_sandbox", False),
+    )
+
+    return response
+
+
+def gemini_code_generate_docs_many(
+    jobs: List[Dict[str, Any]],
+    config: Any,
+) -> Tuple[Dict[str, str], Dict[str, GeminiCodeError]]:
+    """
+    Generate documentation for several modules in parallel using a thread pool.
+
+    Synchronous alternative to `gemini_code_generate_docs_async` for callers that
+    don't run an event loop. The work is I/O-bound on the CLI subprocess, so
+    threads overlap well. Results are collected as they complete, and a failing
+    module is reported in the error dict instead of aborting the batch.
+
+    Args:
+        jobs: List of keyword-argument dicts for `gemini_code_generate_docs`
+              (module_name, core_component_ids, components, module_tree, output_path)
+        config: Configuration object
+
+    Returns:
+        Tuple of (module name -> documentation, module name -> error)
+    """
+    max_workers = max(1, getattr(config, "gemini_code_concurrency", DEFAULT_GEMINI_CODE_CONCURRENCY))
+    results: Dict[str, str] = {}
+    errors: Dict[str, GeminiCodeError] = {}
+
+    if not jobs:
+        return results, errors
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        futures = {
+            executor.submit(gemini_code_generate_docs, config=config, **job): job["module_name"]
+            for job in jobs
+        }
+        for future in as_completed(futures):
+            module_name = futures[future]
+            try:
+                results[module_name] = future.result()
+            except GeminiCodeError as e:
+                logger.error(f"Gemini CLI documentation generation failed for {module_name}: {e}")
+                errors[module_name] = e
+            except Exception as e:
+                logger.error(f"Gemini CLI documentation generation failed for {module_name}: {e}")
+                errors[module_name] = GeminiCodeError(str(e))
+
+    return results, errors
+
+
+def _build_batch_prompt(job_prompts: List[Tuple[str, str]]) -> str:
+    """Wrap several module documentation prompts into one batched prompt."""
+    parts = [
+        "You are a documentation assistant. Complete each of the documentation tasks below "
+        "independently.\n\n"
+        "IMPORTANT: Do not write any files. For every task, output its markdown documentation "
+        "wrapped exactly like this, using the task's module name:\n"
+        '<<<DOC name="MODULE_NAME">>>\n'
+        "...markdown documentation...\n"
+        '<<<END name="MODULE_NAME">>>\n'
+    ]
+    for module_name, prompt in job_prompts:
+        parts.append(f'\n=== TASK: module "{module_name}" ===\n\n{prompt}\n\n=== END TASK ===')
+    return "\n".join(parts)
+
+
+def gemini_code_generate_docs_batch(
+    jobs: List[Dict[str, Any]],
+    config: Any,
+    batch_tokens: int = DEFAULT_BATCH_TOKENS,
+    max_batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Dict[str, str]:
+    """
+    Generate documentation for several modules with as few Gemini CLI calls as possible.
+
+    Module prompts are packed into batches of up to `max_batch_size` modules and
+    `batch_tokens` tokens; each batch is one CLI call whose response is split on
+    per-module sentinels. Modules missing from a response are left out of the
+    result so the caller can fall back to `gemini_code_generate_docs`.
+
+    Args:
+        jobs: List of dicts with module_name, core_component_ids, components and module_tree
+        config: Configuration object
+        batch_tokens: Maximum prompt tokens per batch
+        max_batch_size: Maximum number of modules per batch
+
+    Returns:
+        Dictionary mapping module names to generated documentation
+
+    Raises:
+        GeminiCodeError: If a CLI invocation fails
+    """
+    # Pack jobs into batches
+    batches: List[List[Tuple[str, str]]] = []
+    current: List[Tuple[str, str]] = []
+    current_tokens = 0
+    for job in jobs:
+        system_prompt, user_prompt = _build_module_prompts(
+            job["module_name"], job["core_component_ids"], job["components"], job["module_tree"], config
+        )
+        prompt = f"{system_prompt}\n\n---\n\n{user_prompt}"
+        prompt_tokens = count_tokens(prompt)
+        if current and (len(current) >= max_batch_size or current_tokens + prompt_tokens > batch_tokens):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append((job["module_name"], prompt))
+        current_tokens += prompt_tokens
+    if current:
+        batches.append(current)
+
+    # Get timeout and path from config
+    timeout = getattr(config, "gemini_code_timeout", DEFAULT_GEMINI_CODE_TIMEOUT)
+    gemini_path = getattr(config, "gemini_code_path", None)
+    repo_path = getattr(config, "repo_path", None)
+
+    results: Dict[str, str] = {}
+    for batch in batches:
+        logger.info(f"Invoking Gemini CLI for batched documentation of {len(batch)} modules")
+        response = _invoke_gemini_code(
+            _build_batch_prompt(batch),
+            timeout=timeout,
+            gemini_code_path=gemini_path,
+            working_dir=repo_path,
+            disable_sandbox=getattr(config, "gemini_disable_sandbox", False),
+        )
+
+        requested = {module_name for module_name, _ in batch}
+        for match in _BATCH_DOC_RE.finditer(response):
+            module_name = match.group(1)
+            if module_name in requested:
+                results[module_name] = match.group(2).strip()
+
+        missing = requested - results.keys()
+        if missing:
+            logger.warning(f"Batched Gemini response is missing docs for: {', '.join(sorted(missing))}")
+
+    return results
+
+
 def gemini_code_generate_overview(
     prompt: str,
     config: Any,
@@ -402,6 +1036,12 @@ def gemini_code_generate_overview(
         timeout=timeout,
         gemini_code_path=gemini_path,
         working_dir=repo_path,
+        cache_dir=_get_cache_dir(config),
+        cache_ttl=getattr(config, "gemini_cache_ttl", None),
+        disable_sandbox=getattr(config, "gemini_disable_sandbox", False),
+        # The caller extracts the docs from <OVERVIEW> tags; anything else may be
+        # a confirmation that the CLI wrote a file, which a cache hit would not redo
+        cacheable=lambda response: "<OVERVIEW>" in response,
     )
 
     return response
@@ -0,0 +1,536 @@
+"""
+Dependency graph diffing for incremental documentation builds.
+
+Compares the dependency graph persisted by a previous run with the freshly
+built one, expands the changed components to their dependents, and maps the
+result onto the module tree so only affected modules are re-documented.
+
+Graphs are the dicts written by `DependencyParser.save_dependency_graph`:
+`{component_id: {"source_code": ..., "depends_on": [...], ...}}`.
+"""
+
+import functools
+import gzip
+import hashlib
+import itertools
+import json
+import logging
+import os
+import re
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # optional speedup for large graphs
+    _json_loads = json.loads
+
+try:
+    from isal import igzip
+
+    _gzip_decompress = igzip.decompress
+except ImportError:  # optional ISA-L accelerated gzip
+    _gzip_decompress = gzip.decompress
+
+try:
+    import ijson
+except ImportError:  # optional, used to stream very large graph files
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+# Corrupt files: json/orjson errors subclass ValueError, ijson and gzip have their own
+_DECODE_ERRORS = (ValueError, UnicodeDecodeError, EOFError, zlib.error, gzip.BadGzipFile) + (
+    (ijson.JSONError,) if ijson is not None else ()
+)
+
+# Uncompressed graph files above this size are stream-parsed with ijson when available
+_STREAM_PARSE_BYTES = 500 * 1024 * 1024
+
+# Source normalization: 3+ newlines -> one blank line
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# Slice size (characters) for hashing large sources without a full bytes copy
+_HASH_CHUNK_CHARS = 1 << 20
+
+
+@dataclass(slots=True)
+class DiffResult:
+    """Component IDs that differ between two dependency graphs."""
+
+    added: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+    modified: Set[str] = field(default_factory=set)
+
+    @property
+    def all_changed(self) -> Set[str]:
+        """All added, removed and modified component IDs."""
+        return self.added | self.removed | self.modified
+
+    @property
+    def is_empty(self) -> bool:
+        """True if the graphs are equivalent."""
+        return not (self.added or self.removed or self.modified)
+
+
+class DependencyGraph(dict):
+    """
+    A dependency graph returned by `freeze_graph`, carrying data derived from it.
+
+    The reverse dependency map is memoized on the graph itself, so it lives
+    exactly as long as the graph its caller holds.
+    """
+
+    __slots__ = ("_reverse_deps",)
+
+
+def load_graph(path: str) -> DependencyGraph:
+    """
+    Load a persisted dependency graph.
+
+    Args:
+        path: Path to a `.json` or `.json.gz` dependency graph file
+
+    Returns:
+        Dictionary mapping component IDs to component data
+
+    Raises:
+        ValueError: If the file is not valid JSON or not a JSON object
+    """
+    try:
+        if path.endswith(".gz"):
+            # One-shot decompression of the whole buffer beats streaming through GzipFile
+            with open(path, "rb") as f:
+                graph = _json_loads(_gzip_decompress(f.read()))
+        elif ijson is not None and os.path.getsize(path) > _STREAM_PARSE_BYTES:
+            # Build the dict while reading instead of holding the raw text too
+            with open(path, "rb") as f:
+                graph = dict(ijson.kvitems(f, "", use_float=True))
+        else:
+            with open(path, "rb") as f:
+                graph = _json_loads(f.read())
+    except _DECODE_ERRORS as e:
+        raise ValueError(f"Invalid dependency graph file {path}: {e}") from e
+
+    if not isinstance(graph, dict):
+        raise ValueError(f"Invalid dependency graph file {path}: expected a JSON object")
+    return freeze_graph(graph)
+
+
+def freeze_graph(graph: Dict[str, Any]) -> DependencyGraph:
+    """
+    Convert each component's `depends_on` to a frozenset and `parameters` to a tuple, in place.
+
+    Done once per graph so diffs can compare them without per-component allocations.
+
+    Args:
+        graph: Dependency graph
+
+    Returns:
+        The graph as a `DependencyGraph` (the same object if it already is one)
+    """
+    for comp_data in graph.values():
+        _freeze_component(comp_data)
+    if isinstance(graph, DependencyGraph):
+        return graph
+    return DependencyGraph(graph)
+
+
+def _freeze_component(comp_data: Any) -> Any:
+    """Freeze one component's `depends_on` and `parameters` in place."""
+    if isinstance(comp_data, dict):
+        depends_on = comp_data.get("depends_on")
+        if isinstance(depends_on, (list, set, tuple)):
+            comp_data["depends_on"] = frozenset(depends_on)
+        parameters = comp_data.get("parameters")
+        if isinstance(parameters, list):
+            comp_data["parameters"] = tuple(parameters)
+    return comp_data
+
+
+def _normalize_source(source: str) -> str:
+    """Normalize whitespace so formatting-only edits don't count as modifications."""
+    # str.replace is a memchr-driven C loop; str.translate with a dict table
+    # falls back to a per-character path on non-ASCII text (~100x slower)
+    if "\r" in source:
+        source = source.replace("\r\n", "\n").replace("\r", "\n")
+    if "\t" in source:
+        source = source.replace("\t", "    ")
+    source = "\n".join([line.rstrip() for line in source.split("\n")])
+    if "\n\n\n" in source:
+        source = _BLANK_LINES_RE.sub("\n\n", source)
+    return source.strip()
+
+
+# Memoized variant for diffing graphs saved without digests, where the same
+# sources may be compared repeatedly. Digest computation sees every source once
+# per save and uses the uncached function, so whole repositories never land here.
+_normalize_source_cached = functools.lru_cache(maxsize=1024)(_normalize_source)
+
+
+def clear_normalize_cache() -> None:
+    """Drop memoized source normalizations."""
+    _normalize_source_cached.cache_clear()
+
+
+def _compute_source_hash(source: Union[str, bytes]) -> str:
+    """
+    SHA-256 of the source code, for persisting alongside a graph.
+
+    Text is normalized first; bytes are taken as already-normalized UTF-8 and
+    hashed without a copy. Large texts are encoded in bounded slices instead
+    of materializing a full-size bytes copy.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(source).hexdigest()
+
+    normalized = _normalize_source(source)
+    hasher = hashlib.sha256()
+    if len(normalized) <= _HASH_CHUNK_CHARS:
+        hasher.update(normalized.encode("utf-8"))
+    else:
+        for start in range(0, len(normalized), _HASH_CHUNK_CHARS):
+            hasher.update(normalized[start:start + _HASH_CHUNK_CHARS].encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def compute_source_digest(source: Optional[str]) -> str:
+    """
+    Digest of a component's normalized source, stored as `source_digest` in persisted graphs.
+
+    Args:
+        source: Component source code
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return _compute_source_hash(source or "")
+
+
+def _dependency_set(comp: Dict[str, Any]) -> frozenset:
+    """A component's dependencies as a set, reusing the frozenset from `freeze_graph`."""
+    depends_on = comp.get("depends_on")
+    if isinstance(depends_on, frozenset):
+        return depends_on
+    return frozenset(depends_on or ())
+
+
+def _parameters_key(comp: Dict[str, Any]) -> Optional[tuple]:
+    """A component's parameters as a tuple, reusing the tuple from `freeze_graph`."""
+    parameters = comp.get("parameters")
+    if parameters is None or isinstance(parameters, tuple):
+        return parameters
+    return tuple(parameters)
+
+
+def _is_modified(old_comp: Dict[str, Any], new_comp: Dict[str, Any]) -> bool:
+    """Check whether a component's source, dependencies or signature changed."""
+    # Cheap metadata checks first, so a changed component can skip the source text
+    if old_comp.get("file_path") != new_comp.get("file_path"):
+        return True
+
+    if _dependency_set(old_comp) != _dependency_set(new_comp):
+        return True
+
+    if _parameters_key(old_comp) != _parameters_key(new_comp):
+        return True
+
+    old_digest = old_comp.get("source_digest")
+    new_digest = new_comp.get("source_digest")
+    if old_digest and new_digest:
+        # Persisted digests of the normalized source: no need to touch the text
+        return old_digest != new_digest
+
+    # Graphs saved without digests. Identical raw sources (the common case) need
+    # no normalization, and unequal ones are compared directly: hashing would
+    # only add a pass over the text
+    old_source = old_comp.get("source_code") or ""
+    new_source = new_comp.get("source_code") or ""
+    if old_source is new_source or old_source == new_source:
+        return False
+    return _normalize_source_cached(old_source) != _normalize_source_cached(new_source)
+
+
+def _signature(comp: Dict[str, Any]) -> Optional[tuple]:
+    """
+    Everything `_is_modified` compares, as one tuple for equality checks.
+
+    The tuple is not necessarily hashable: `parameters` entries may be lists or
+    dicts, so it must not be used as a set member or dict key.
+
+    Returns None for components without a persisted source digest, which need
+    the source text comparison in `_is_modified` instead.
+    """
+    digest = comp.get("source_digest")
+    if not digest:
+        return None
+    return (digest, _dependency_set(comp), _parameters_key(comp), comp.get("file_path"))
+
+
+def _component_changed(old_comp: Dict[str, Any], new_comp: Dict[str, Any]) -> bool:
+    """Compare by signature when both components have digests, else via `_is_modified`."""
+    old_sig = _signature(old_comp)
+    new_sig = _signature(new_comp)
+    if old_sig is None or new_sig is None:
+        return _is_modified(old_comp, new_comp)
+    return old_sig != new_sig
+
+
+def compare_dependency_graphs(old_graph: Dict[str, Any], new_graph: Dict[str, Any]) -> DiffResult:
+    """
+    Compare two dependency graphs.
+
+    Args:
+        old_graph: Graph from the previous run
+        new_graph: Graph from the current run
+
+    Returns:
+        DiffResult with added, removed and modified component IDs
+    """
+    # dict_keys set operations return sets without copying either key set first
+    added = new_graph.keys() - old_graph.keys()
+    removed = old_graph.keys() - new_graph.keys()
+    common_ids = old_graph.keys() & new_graph.keys()
+
+    modified = set()
+    for comp_id in common_ids:
+        if _component_changed(old_graph[comp_id], new_graph[comp_id]):
+            modified.add(comp_id)
+
+    logger.debug(f"Graph diff: {len(added)} added, {len(removed)} removed, {len(modified)} modified")
+    return DiffResult(added=added, removed=removed, modified=modified)
+
+
+def compare_graph_files(old_path: str, new_path: str) -> DiffResult:
+    """
+    Compare two persisted dependency graphs without loading the new one whole.
+
+    The old graph is loaded; the new one is streamed component by component
+    with ijson when it is installed, so only one full graph is held in
+    memory. Without ijson this is `compare_dependency_graphs` on both files.
+
+    Args:
+        old_path: Path to the previous `.json` or `.json.gz` graph
+        new_path: Path to the current `.json` or `.json.gz` graph
+
+    Returns:
+        DiffResult with added, removed and modified component IDs
+
+    Raises:
+        ValueError: If either file is not a valid dependency graph
+    """
+    old_graph = load_graph(old_path)
+    if ijson is None:
+        return compare_dependency_graphs(old_graph, load_graph(new_path))
+
+    added = set()
+    modified = set()
+    seen = set()
+    opener = gzip.open if new_path.endswith(".gz") else open
+    try:
+        with opener(new_path, "rb") as f:
+            events = ijson.parse(f, use_float=True)
+            first_event = next(events, None)
+            # Same contract as load_graph: a top level that isn't an object is
+            # an invalid graph, not a graph with every component removed
+            is_object = first_event is not None and first_event[1] == "start_map"
+            if is_object:
+                for comp_id, new_comp in ijson.kvitems(itertools.chain((first_event,), events), ""):
+                    seen.add(comp_id)
+                    old_comp = old_graph.get(comp_id)
+                    if old_comp is None:
+                        added.add(comp_id)
+                    elif _component_changed(old_comp, _freeze_component(new_comp)):
+                        modified.add(comp_id)
+    except _DECODE_ERRORS as e:
+        raise ValueError(f"Invalid dependency graph file {new_path}: {e}") from e
+    if not is_object:
+        raise ValueError(f"Invalid dependency graph file {new_path}: expected a JSON object")
+
+    removed = old_graph.keys() - seen
+    logger.debug(f"Graph diff: {len(added)} added, {len(removed)} removed, {len(modified)} modified")
+    return DiffResult(added=added, removed=removed, modified=modified)
+
+
+def _build_reverse_deps(graph: Dict[str, Any]) -> Dict[str, Set[str]]:
+    """Map each component ID to the components that depend on it."""
+    reverse_deps = defaultdict(set)
+    dependents_of = reverse_deps.__getitem__
+    for comp_id, comp_data in graph.items():
+        # Well-formed nodes are the norm: skip malformed ones by exception
+        # rather than type-checking every node and dependency
+        try:
+            depends_on = comp_data["depends_on"]
+            if isinstance(depends_on, str):
+                continue
+            for dep in depends_on:
+                dependents_of(dep).add(comp_id)
+        except (KeyError, TypeError):
+            continue
+    # Plain dict for readers: lookups of components without dependents can't insert
+    return dict(reverse_deps)
+
+
+def _get_reverse_deps(graph: Dict[str, Any]) -> Dict[str, Set[str]]:
+    """Return the reverse dependency map of a graph, built once per `DependencyGraph`."""
+    if not isinstance(graph, DependencyGraph):
+        return _build_reverse_deps(graph)
+
+    reverse_deps = getattr(graph, "_reverse_deps", None)
+    if reverse_deps is None:
+        reverse_deps = graph._reverse_deps = _build_reverse_deps(graph)
+    return reverse_deps
+
+
+def invalidate_reverse_deps(graph: Dict[str, Any]) -> None:
+    """Drop the memoized reverse dependency map of a graph mutated in place."""
+    if isinstance(graph, DependencyGraph):
+        graph._reverse_deps = None
+
+
+def get_affected_components(
+    changed_components: Iterable[str],
+    graph: Dict[str, Any],
+    depth: int = 1,
+) -> Set[str]:
+    """
+    Expand changed components to the components that depend on them.
+
+    Args:
+        changed_components: Component IDs that changed
+        graph: Dependency graph used to find dependents (a `freeze_graph`
+            result reuses its reverse dependency map across calls)
+        depth: How many levels of dependents to include (0 = changed only)
+
+    Returns:
+        The changed components plus their dependents up to `depth` levels
+
+    Raises:
+        ValueError: If depth is negative
+    """
+    if depth < 0:
+        raise ValueError(f"depth must be non-negative, got {depth}")
+
+    affected = set(changed_components)
+    # Nothing to expand: don't pay for building the reverse dependency map
+    if not affected or depth == 0:
+        return affected
+
+    reverse_deps = _get_reverse_deps(graph)
+
+    # Level-by-level expansion using C-level set union/difference per level.
+    # Changed components nobody depends on (including IDs absent from the
+    # graph) can't expand, so drop them from the first level in one set op.
+    current_level = affected & reverse_deps.keys()
+    for _ in range(depth):
+        next_level = set().union(*(reverse_deps.get(comp_id, ()) for comp_id in current_level))
+        next_level -= affected
+        if not next_level:
+            break
+        affected |= next_level
+        current_level = next_level
+
+    return affected
+
+
+def _infer_module_from_component_id(component_id: str) -> str:
+    """
+    Best-effort source module of a component ID.
+
+    e.g. `pkg.mod.Class.method` -> `pkg/mod`, `pkg.mod.func` -> `pkg/mod`.
+    """
+    if "/" in component_id:
+        return component_id.rpartition("/")[0]
+
+    # Drop the class or function name
+    head, sep, _ = component_id.rpartition(".")
+    if not sep:
+        return component_id
+    # For `Class.method`, drop the class name too
+    owner_head, sep, owner = head.rpartition(".")
+    if sep and owner[:1].isupper():
+        head = owner_head
+    return head.replace(".", "/")
+
+
+def _build_component_to_module_map(module_tree: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Map each component ID to the module paths (`a/b`) listing it, in a single tree walk."""
+    component_map: Dict[str, List[str]] = {}
+    # Explicit stack instead of recursion: no per-level call overhead or recursion limit
+    stack = [(module_tree, "")]
+    while stack:
+        tree, parent_key = stack.pop()
+        for module_name, module_info in tree.items():
+            if not isinstance(module_info, dict):
+                continue
+            module_key = f"{parent_key}/{module_name}" if parent_key else module_name
+            for comp_id in module_info.get("components", []):
+                component_map.setdefault(comp_id, []).append(module_key)
+
+            children = module_info.get("children")
+            if isinstance(children, dict) and children:
+                stack.append((children, module_key))
+
+    return component_map
+
+
+def index_components_by_module(module_tree: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    Index a module tree by component ID.
+
+    Build it once and pass it to `map_components_to_modules` when mapping
+    several component sets against the same tree.
+
+    Args:
+        module_tree: Module tree as produced by clustering
+
+    Returns:
+        Dictionary mapping component IDs to module paths joined with `/`
+    """
+    return _build_component_to_module_map(module_tree)
+
+
+def map_components_to_modules(
+    components: Iterable[str],
+    module_tree: Dict[str, Any],
+    component_index: Optional[Dict[str, List[str]]] = None,
+) -> Set[str]:
+    """
+    Find the module paths containing the given components.
+
+    Components missing from the tree (e.g. newly added ones) are attributed to
+    the modules that document other components from the same source module.
+
+    Args:
+        components: Component IDs
+        module_tree: Module tree as produced by clustering
+        component_index: Optional index from `index_components_by_module`
+
+    Returns:
+        Set of module paths joined with `/`
+    """
+    if component_index is None:
+        component_index = index_components_by_module(module_tree)
+
+    modules = set()
+    unmapped = []
+    for comp_id in components:
+        module_keys = component_index.get(comp_id)
+        if module_keys:
+            modules.update(module_keys)
+        else:
+            unmapped.append(comp_id)
+
+    # Only components missing from the tree need the source-module fallback
+    if unmapped:
+        source_module_map: Dict[str, Set[str]] = defaultdict(set)
+        for comp_id, module_keys in component_index.items():
+            source_module_map[_infer_module_from_component_id(comp_id)].update(module_keys)
+        for comp_id in unmapped:
+            modules.update(source_module_map.get(_infer_module_from_component_id(comp_id), ()))
+
+    return modules
@@ -210,7 +210,8 @@ Please shortlist the files, folders representing the core functionality and igno
 Reasoning at first, then return the list of relative paths in JSON format.
 """
 
-from typing import Dict, Any
+import string
+from typing import Dict, Any, Optional, Tuple
 from codewiki.src.utils import file_manager
 
 EXTENSION_TO_LANGUAGE = {
@@ -373,4 +374,85 @@ def format_leaf_system_prompt(module_name: str, custom_instructions: str = None)
     if custom_instructions:
         custom_section = f"\n\n<CUSTOM_INSTRUCTIONS>\n{custom_instructions}\n</CUSTOM_INSTRUCTIONS>"
     
-    return LEAF_SYSTEM_PROMPT.format(module_name=module_name, custom_instructions=custom_section).strip()
\ No newline at end of file
+    return LEAF_SYSTEM_PROMPT.format(module_name=module_name, custom_instructions=custom_section).strip()
+
+
+# Stand-in for the module name in the static system prompt prefix, bound in SESSION_CONTEXT
+MODULE_NAME_PLACEHOLDER = "MODULE_NAME"
+
+_STATIC_SYSTEM_PROMPT = SYSTEM_PROMPT.format(module_name=MODULE_NAME_PLACEHOLDER, custom_instructions="").strip()
+_STATIC_LEAF_SYSTEM_PROMPT = LEAF_SYSTEM_PROMPT.format(module_name=MODULE_NAME_PLACEHOLDER, custom_instructions="").strip()
+
+
+def format_system_prompt_parts(module_name: str, custom_instructions: str = None, leaf: bool = False) -> Tuple[str, str]:
+    """
+    Split the system prompt into a static prefix and a per-module session context.
+
+    The prefix is identical for every module of the same kind, so placing it
+    first lets provider-side prompt caches reuse it across invocations.
+
+    Args:
+        module_name: Name of the module to document
+        custom_instructions: Optional custom instructions to append
+        leaf: Whether to use the leaf system prompt
+
+    Returns:
+        Tuple of (static prefix, session context)
+    """
+    static_prefix = _STATIC_LEAF_SYSTEM_PROMPT if leaf else _STATIC_SYSTEM_PROMPT
+
+    session_context = f"SESSION_CONTEXT:\n{MODULE_NAME_PLACEHOLDER} = {module_name}"
+    if custom_instructions:
+        session_context += f"\n\n<CUSTOM_INSTRUCTIONS>\n{custom_instructions}\n</CUSTOM_INSTRUCTIONS>"
+
+    return static_prefix, session_context
+
+
+def _split_template(template: str) -> list[tuple[str, Optional[str]]]:
+    """
+    Pre-parse a format template into (literal_text, field_name) fragments.
+
+    Rendering the fragments with ``_render_template`` is equivalent to
+    ``template.format(...)`` without re-parsing the template on every call.
+    """
+    return [(literal, field) for literal, field, _, _ in string.Formatter().parse(template)]
+
+
+def _render_template(fragments: list[tuple[str, Optional[str]]], **values: str) -> str:
+    """Render fragments produced by ``_split_template`` with the given field values."""
+    return "".join(
+        literal + values[field] if field is not None else literal
+        for literal, field in fragments
+    )
+
+
+_REPO_OVERVIEW_FRAGMENTS = _split_template(REPO_OVERVIEW_PROMPT)
+_MODULE_OVERVIEW_FRAGMENTS = _split_template(MODULE_OVERVIEW_PROMPT)
+
+
+def format_repo_overview_prompt(repo_name: str, repo_structure: str) -> str:
+    """
+    Format the repository overview prompt.
+    
+    Args:
+        repo_name: Name of the repository
+        repo_structure: JSON-encoded repo structure with core module docs
+        
+    Returns:
+        Formatted repository overview prompt string
+    """
+    return _render_template(_REPO_OVERVIEW_FRAGMENTS, repo_name=repo_name, repo_structure=repo_structure)
+
+
+def format_module_overview_prompt(module_name: str, repo_structure: str) -> str:
+    """
+    Format the module overview prompt.
+    
+    Args:
+        module_name: Name of the module to summarize
+        repo_structure: JSON-encoded repo structure with child module docs
+        
+    Returns:
+        Formatted module overview prompt string
+    """
+    return _render_template(_MODULE_OVERVIEW_FRAGMENTS, module_name=module_name, repo_structure=repo_structure)
@@ -32,8 +32,11 @@ enc = tiktoken.encoding_for_model("gpt-4")
 def count_tokens(text: str) -> int:
     """
     Count the number of tokens in a text.
+
+    Special-token strings such as ``<|endoftext|>`` (common in LLM-related code)
+    are counted as plain text instead of making tiktoken raise.
     """
-    length = len(enc.encode(text))
+    length = len(enc.encode(text, disallowed_special=()))
     # logger.debug(f"Number of tokens: {length}")
     return length
 
@@ -73,6 +73,12 @@ class Config:
     use_gemini_code: bool = False
     gemini_code_path: Optional[str] = None
     gemini_code_timeout: int = 600
+    gemini_code_concurrency: int = 4
+    gemini_cache_enabled: bool = False
+    gemini_cache_ttl: Optional[int] = None
+    gemini_disable_sandbox: bool = False
+    # Incremental builds: levels of dependents re-documented along with changed components
+    affect_depth: int = 1
     
     @property
     def include_patterns(self) -> Optional[List[str]]:
@@ -178,6 +184,11 @@ class Config:
         use_gemini_code: bool = False,
         gemini_code_path: Optional[str] = None,
         gemini_code_timeout: int = 600,
+        gemini_code_concurrency: int = 4,
+        gemini_cache_enabled: bool = False,
+        gemini_cache_ttl: Optional[int] = None,
+        gemini_disable_sandbox: bool = False,
+        affect_depth: int = 1,
     ) -> 'Config':
         """
         Create configuration for CLI context.
@@ -199,9 +210,14 @@ class Config:
             use_claude_code: Whether to use Claude Code CLI as LLM backend
             claude_code_path: Optional path to claude CLI executable
             claude_code_timeout: Timeout for Claude Code CLI in seconds
-            use_gemini_code: Whether to use Gemini CLI as LLM backend (larger context)
+            use_gemini_code: Whether to use Gemini CLI as LLM backend for clustering and docs (larger context)
             gemini_code_path: Optional path to gemini CLI executable
             gemini_code_timeout: Timeout for Gemini CLI in seconds
+            gemini_code_concurrency: Maximum concurrent Gemini CLI invocations for module docs
+            gemini_cache_enabled: Whether to cache Gemini CLI responses on disk
+            gemini_cache_ttl: Lifetime of cached Gemini responses in seconds (None = no expiry)
+            gemini_disable_sandbox: Run Gemini CLI without its sandbox (trusted environments only)
+            affect_depth: Levels of dependents to re-document when components change
 
         Returns:
             Config instance
@@ -231,4 +247,9 @@ class Config:
             use_gemini_code=use_gemini_code,
             gemini_code_path=gemini_code_path,
             gemini_code_timeout=gemini_code_timeout,
+            gemini_code_concurrency=gemini_code_concurrency,
+            gemini_cache_enabled=gemini_cache_enabled,
+            gemini_cache_ttl=gemini_cache_ttl,
+            gemini_disable_sandbox=gemini_disable_sandbox,
+            affect_depth=affect_depth,
         )
@@ -0,0 +1,124 @@
+"""Tests for incremental documentation generation across runs."""
+
+import asyncio
+import itertools
+import json
+
+import pytest
+
+from codewiki.src.be import documentation_generator
+from codewiki.src.be.documentation_generator import DocumentationGenerator
+from codewiki.src.config import Config, FIRST_MODULE_TREE_FILENAME, MODULE_TREE_FILENAME
+
+# "core" lists a component of its own besides its two leaf children
+MODULE_TREE = {
+    "core": {
+        "components": ["pkg.core.Core"],
+        "children": {
+            "models": {"components": ["pkg.models.User"]},
+            "services": {"components": ["pkg.services.UserService"]},
+        },
+    },
+}
+
+
+def _graph(**sources):
+    return {
+        comp_id: {"source_code": source, "depends_on": []}
+        for comp_id, source in {
+            "pkg.core.Core": "class Core: pass",
+            "pkg.models.User": "class User: pass",
+            "pkg.services.UserService": "class UserService: pass",
+            **sources,
+        }.items()
+    }
+
+
+class StubAgentOrchestrator:
+    """Writes numbered leaf docs instead of running an agent, recording each module."""
+
+    def __init__(self, config):
+        self.calls = []
+        self._numbers = itertools.count(1)
+
+    async def process_module(self, module_name, components, core_component_ids, module_path, working_dir):
+        self.calls.append(module_name)
+        with open(f"{working_dir}/{module_name}.md", "w") as f:
+            f.write(f"{module_name} docs #{next(self._numbers)}")
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    for filename in (MODULE_TREE_FILENAME, FIRST_MODULE_TREE_FILENAME):
+        (docs_dir / filename).write_text(json.dumps(MODULE_TREE))
+
+    overview_calls = []
+    overview_numbers = itertools.count(1)
+
+    def fake_call_llm(prompt, config):
+        overview_calls.append(prompt)
+        return f"<OVERVIEW>overview #{next(overview_numbers)}</OVERVIEW>"
+
+    monkeypatch.setattr(documentation_generator, "AgentOrchestrator", StubAgentOrchestrator)
+    monkeypatch.setattr(documentation_generator, "call_llm", fake_call_llm)
+
+    config = Config(
+        repo_path=str(tmp_path / "repo"),
+        output_dir=str(tmp_path),
+        dependency_graph_dir=str(tmp_path / "graphs"),
+        docs_dir=str(docs_dir),
+        max_depth=2,
+        llm_base_url="http://localhost",
+        llm_api_key="test",
+        main_model="main",
+        cluster_model="cluster",
+    )
+    generator = DocumentationGenerator(config)
+    generator.graph_builder.save_documented_graph = lambda: None
+    generator.overview_calls = overview_calls
+    return generator
+
+
+def _run(generator, previous_graph, current_graph):
+    """Run one generation against the given graphs, returning (leaf calls, overview calls)."""
+    generator.graph_builder.previous_graph = previous_graph
+    generator.graph_builder.current_graph = current_graph
+    generator.agent_orchestrator.calls.clear()
+    generator.overview_calls.clear()
+    working_dir = asyncio.run(generator.generate_module_documentation({}, []))
+    # As in run(): metadata carries the child docs digests into the next run
+    generator.create_documentation_metadata(working_dir, {}, 0)
+    return list(generator.agent_orchestrator.calls), len(generator.overview_calls)
+
+
+def test_regenerates_only_affected_modules_across_runs(generator):
+    docs_dir = generator.config.docs_dir
+
+    # First run documents everything: two leaves, the parent and the overview
+    leaf_calls, overview_calls = _run(generator, None, _graph())
+    assert sorted(leaf_calls) == ["models", "services"]
+    assert overview_calls == 2
+
+    # Unchanged graph: every doc is kept
+    leaf_calls, overview_calls = _run(generator, _graph(), _graph())
+    assert leaf_calls == []
+    assert overview_calls == 0
+
+    # Changed leaf component: that leaf, then its parent and the overview through
+    # the child docs digest
+    changed_leaf = _graph(**{"pkg.models.User": "class User:\n    name = ''"})
+    leaf_calls, overview_calls = _run(generator, _graph(), changed_leaf)
+    assert leaf_calls == ["models"]
+    assert overview_calls == 2
+
+    # Changed component listed only on the parent: no leaf is redone, but the
+    # parent docs are regenerated rather than kept
+    parent_docs_before = open(f"{docs_dir}/core.md").read()
+    changed_parent = _graph(**{"pkg.models.User": "class User:\n    name = ''",
+                               "pkg.core.Core": "class Core:\n    version = 2"})
+    leaf_calls, overview_calls = _run(generator, changed_leaf, changed_parent)
+    assert leaf_calls == []
+    assert overview_calls == 2
+    assert open(f"{docs_dir}/core.md").read() != parent_docs_before
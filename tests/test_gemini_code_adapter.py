@@ -0,0 +1,67 @@
+"""Tests for Gemini CLI subprocess handling in the Gemini CLI adapter."""
+
+import asyncio
+import os
+import subprocess
+import time
+
+import pytest
+
+from codewiki.src.be.gemini_code_adapter import (
+    GeminiCodeError,
+    _invoke_gemini_code_async,
+    _run_streaming,
+)
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="fake CLI is a POSIX shell script")
+
+# Long enough that a timeout waiting on the grandchild is unmistakable
+GRANDCHILD_SECONDS = 30
+
+
+@pytest.fixture
+def fake_cli(tmp_path):
+    """A fake Gemini CLI whose grandchild (like a YOLO tool call) holds stdout open."""
+    cli = tmp_path / "gemini"
+    cli.write_text(
+        "#!/bin/sh\n"
+        "cat > /dev/null\n"
+        f"sleep {GRANDCHILD_SECONDS}\n"
+        "echo done\n"
+    )
+    cli.chmod(0o755)
+    return cli
+
+
+@pytest.fixture
+def crlf_cli(tmp_path):
+    """A fake Gemini CLI that answers with Windows line endings and a log line."""
+    cli = tmp_path / "gemini"
+    cli.write_text(
+        "#!/bin/sh\n"
+        "cat > /dev/null\n"
+        "printf 'YOLO mode is enabled.\\r\\nhello\\r\\n\\r\\nworld\\r\\n'\n"
+    )
+    cli.chmod(0o755)
+    return cli
+
+
+def test_sync_and_async_paths_return_identical_output(crlf_cli):
+    returncode, sync_output, _ = _run_streaming([str(crlf_cli)], "prompt", timeout=10, working_dir=None)
+    async_output = asyncio.run(_invoke_gemini_code_async("prompt", timeout=10, gemini_code_path=str(crlf_cli)))
+    assert returncode == 0
+    assert sync_output == async_output == "hello\n\nworld\n"
+
+
+def test_run_streaming_timeout_kills_grandchildren(fake_cli):
+    start = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired):
+        _run_streaming([str(fake_cli)], "prompt", timeout=1, working_dir=None)
+    assert time.monotonic() - start < GRANDCHILD_SECONDS / 3
+
+
+def test_invoke_async_timeout_kills_grandchildren(fake_cli):
+    start = time.monotonic()
+    with pytest.raises(GeminiCodeError, match="timed out"):
+        asyncio.run(_invoke_gemini_code_async("prompt", timeout=1, gemini_code_path=str(fake_cli)))
+    assert time.monotonic() - start < GRANDCHILD_SECONDS / 3
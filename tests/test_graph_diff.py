@@ -0,0 +1,178 @@
+"""Tests for dependency graph diffing used by incremental documentation builds."""
+
+import json
+
+import pytest
+
+from codewiki.src.be import graph_diff
+from codewiki.src.be.graph_diff import (
+    compare_dependency_graphs,
+    compare_graph_files,
+    freeze_graph,
+    get_affected_components,
+    map_components_to_modules,
+)
+
+
+def _component(source, depends_on=(), **extra):
+    return {"source_code": source, "depends_on": list(depends_on), **extra}
+
+
+@pytest.fixture
+def module_tree():
+    return {
+        "core": {
+            "components": ["pkg.core.Core"],
+            "children": {
+                "models": {"components": ["pkg.models.User", "pkg.models.Group"]},
+                "services": {"components": ["pkg.services.UserService.get"]},
+            },
+        },
+        "cli": {"components": ["pkg.cli.main"]},
+    }
+
+
+@pytest.fixture
+def chain_graph():
+    # c depends on b, which depends on a
+    return {
+        "pkg.a": _component("a"),
+        "pkg.b": _component("b", ["pkg.a"]),
+        "pkg.c": _component("c", ["pkg.b"]),
+        "pkg.unrelated": _component("u"),
+    }
+
+
+@pytest.fixture
+def old_graph_file(tmp_path):
+    path = tmp_path / "old_dependency_graph.json"
+    path.write_text(json.dumps({
+        "pkg.a.A": _component("class A: pass"),
+        "pkg.b.B": _component("class B: pass", ["pkg.a.A"]),
+    }))
+    return str(path)
+
+
+@pytest.fixture(params=["streaming", "in_memory"])
+def diff_mode(request, monkeypatch):
+    """Run compare_graph_files through both the ijson and the load_graph paths."""
+    if request.param == "streaming":
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(graph_diff, "ijson", None)
+    return request.param
+
+
+class TestCompareGraphFiles:
+    def test_reports_changes(self, diff_mode, old_graph_file, tmp_path):
+        new_path = tmp_path / "new_dependency_graph.json"
+        new_path.write_text(json.dumps({
+            "pkg.a.A": _component("class A:\n    x = 1"),
+            "pkg.c.C": _component("class C: pass"),
+        }))
+
+        diff = compare_graph_files(old_graph_file, str(new_path))
+
+        assert diff.added == {"pkg.c.C"}
+        assert diff.removed == {"pkg.b.B"}
+        assert diff.modified == {"pkg.a.A"}
+
+    def test_rejects_non_object_top_level(self, diff_mode, old_graph_file, tmp_path):
+        new_path = tmp_path / "new_dependency_graph.json"
+        new_path.write_text(json.dumps([{"id": "pkg.a.A"}]))
+
+        with pytest.raises(ValueError, match="expected a JSON object"):
+            compare_graph_files(old_graph_file, str(new_path))
+
+    def test_rejects_empty_file(self, diff_mode, old_graph_file, tmp_path):
+        new_path = tmp_path / "new_dependency_graph.json"
+        new_path.write_text("")
+
+        with pytest.raises(ValueError, match="Invalid dependency graph file"):
+            compare_graph_files(old_graph_file, str(new_path))
+
+
+class TestCompareDependencyGraphs:
+    def test_reports_added_removed_and_modified(self):
+        old = {
+            "pkg.a.A": _component("class A: pass"),
+            "pkg.b.B": _component("class B: pass"),
+            "pkg.c.C": _component("class C: pass"),
+        }
+        new = {
+            "pkg.a.A": _component("class A: pass"),
+            "pkg.b.B": _component("class B:\n    x = 1"),
+            "pkg.d.D": _component("class D: pass"),
+        }
+
+        diff = compare_dependency_graphs(old, new)
+
+        assert diff.added == {"pkg.d.D"}
+        assert diff.removed == {"pkg.c.C"}
+        assert diff.modified == {"pkg.b.B"}
+        assert diff.all_changed == {"pkg.b.B", "pkg.c.C", "pkg.d.D"}
+
+    def test_whitespace_only_source_change_is_not_a_modification(self):
+        old = {"pkg.a.A": _component("class A:\n    pass\n")}
+        new = {"pkg.a.A": _component("class A:   \n    pass\n\n\n\n")}
+
+        assert compare_dependency_graphs(old, new).is_empty
+
+    def test_dependency_and_parameter_changes_are_modifications(self):
+        old = {
+            "pkg.a.f": _component("def f(x): pass", ["pkg.b.g"], parameters=["x"]),
+            "pkg.a.h": _component("def h(): pass", ["pkg.b.g"]),
+        }
+        new = {
+            "pkg.a.f": _component("def f(x): pass", ["pkg.b.g"], parameters=["x", "y"]),
+            "pkg.a.h": _component("def h(): pass", ["pkg.b.g", "pkg.c.k"]),
+        }
+
+        assert compare_dependency_graphs(old, new).modified == {"pkg.a.f", "pkg.a.h"}
+
+    def test_frozen_and_plain_graphs_compare_equal(self):
+        graph = {"pkg.a.A": _component("class A: pass", ["pkg.b.B"], parameters=["self"])}
+
+        assert compare_dependency_graphs(graph, freeze_graph(graph)).is_empty
+
+
+class TestGetAffectedComponents:
+    @pytest.mark.parametrize("depth, expected", [
+        (0, {"pkg.a"}),
+        (1, {"pkg.a", "pkg.b"}),
+        (2, {"pkg.a", "pkg.b", "pkg.c"}),
+        (5, {"pkg.a", "pkg.b", "pkg.c"}),
+    ])
+    def test_expands_dependents_up_to_depth(self, chain_graph, depth, expected):
+        assert get_affected_components({"pkg.a"}, chain_graph, depth=depth) == expected
+
+    def test_frozen_graph_gives_same_result(self, chain_graph):
+        frozen = freeze_graph(chain_graph)
+
+        assert get_affected_components({"pkg.a"}, frozen, depth=2) == {"pkg.a", "pkg.b", "pkg.c"}
+        # The memoized reverse dependency map is reused on the second call
+        assert get_affected_components({"pkg.b"}, frozen, depth=1) == {"pkg.b", "pkg.c"}
+
+    def test_keeps_components_missing_from_graph(self, chain_graph):
+        assert get_affected_components({"pkg.removed"}, chain_graph) == {"pkg.removed"}
+
+    def test_rejects_negative_depth(self, chain_graph):
+        with pytest.raises(ValueError, match="non-negative"):
+            get_affected_components({"pkg.a"}, chain_graph, depth=-1)
+
+
+class TestMapComponentsToModules:
+    def test_maps_leaf_and_parent_components(self, module_tree):
+        modules = map_components_to_modules(["pkg.models.User", "pkg.core.Core"], module_tree)
+
+        assert modules == {"core/models", "core"}
+
+    def test_new_component_falls_back_to_source_module(self, module_tree):
+        modules = map_components_to_modules(
+            ["pkg.models.Permission", "pkg.services.UserService.delete"], module_tree
+        )
+
+        assert modules == {"core/models", "core/services"}
+
+    def test_unknown_source_module_maps_to_nothing(self, module_tree):
+        assert map_components_to_modules(["other.thing.Thing"], module_tree) == set()